@@ -73,7 +73,8 @@ class DataLoader(Data):
             self._folder_map[outer_folder][inner_folder], subdir, data_name
         )
         try:
-            return pd.read_parquet(pth)
+            # Map the file instead of reading it into an intermediate buffer
+            return pd.read_parquet(pth, engine="pyarrow", memory_map=True)
         except FileNotFoundError:
             return None
 
@@ -262,19 +263,24 @@ class TeamGameDataLoader(TeamDataLoader):
             )
         return pd.concat(dfs, axis=1)
 
+    def _add_team_stats(
+        self, team_games: pd.DataFrame, stat_names: List[str]
+    ) -> pd.DataFrame:
+        """Compute stats with Stats.compute_all and add them as one block."""
+        stats_block = self.stats.compute_all(team_games, stat_names)
+        return pd.concat(
+            [
+                team_games.drop(columns=list(stats_block.columns), errors="ignore"),
+                stats_block,
+            ],
+            axis=1,
+        )
+
     def add_independent_team_stats(self, team_games: pd.DataFrame) -> pd.DataFrame:
         """Add all basic + team stats to team game statistics"""
-        team_games_dict = team_games.loc[
-            :, team_games.columns.isin(self.stats.basic_required_stat_params)
-        ].to_dict(  # type: ignore
-            orient="list"
+        return self._add_team_stats(
+            team_games, list(self.stats.independent_stat_method_map)
         )
-        for (
-            stat_name,
-            stat_func,
-        ) in self.stats.independent_stat_method_map.items():
-            team_games[stat_name] = stat_func(**team_games_dict)
-        return team_games
 
     def _merge_team_games(self, team_games: pd.DataFrame) -> pd.DataFrame:
         """Merge team game statistics with opponent game statistics, adding 'OPP_' prefix to opponent stats."""
@@ -299,14 +305,9 @@ class TeamGameDataLoader(TeamDataLoader):
 
     def add_dependent_team_stats(self, team_games: pd.DataFrame) -> pd.DataFrame:
         """Add all dependent team stats to team game statistics"""
-        team_games_dict = team_games.loc[
-            :, team_games.columns.isin(self.stats.all_required_stat_params)
-        ].to_dict(  # type: ignore
-            orient="list"
+        return self._add_team_stats(
+            team_games, list(self.stats.dependent_stat_method_map)
         )
-        for stat_name, stat_func in self.stats.dependent_stat_method_map.items():
-            team_games[stat_name] = stat_func(**team_games_dict)
-        return team_games
 
     def load_all_team_games(
         self,
@@ -4,8 +4,7 @@ from nba_api.stats.static import teams
 from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.library.parameters import LeagueID, SeasonTypeNullable
 import pandas as pd
-from cachetools import cached
-from utils.data import retry, cache
+from utils.data import retry, ttl_cache
 
 
 class DataRetriever:
@@ -18,7 +17,7 @@ class DataRetriever:
 class TeamDataRetriever(DataRetriever):
     """Retrieve NBA team data from nba-api."""
 
-    @cached(cache)
+    @ttl_cache()
     @retry
     def retrieve_team_metadata(self) -> List[Dict[str, Any]]:
         """Retrieves team metadata from nba-api.
@@ -28,7 +27,7 @@ class TeamDataRetriever(DataRetriever):
         """
         return teams.get_teams()
 
-    @cached(cache)
+    @ttl_cache()
     @retry
     def retrieve_team_games(
         self, team_id: int, season_type_nullable: str = SeasonTypeNullable.regular
@@ -1,12 +1,10 @@
 # %% Import necessary libraries
 import os
 from typing import Union, List, Dict, Any
-import numpy as np
 import pandas as pd
 from nba_api.stats.static import teams
 from nba_api.stats.library.parameters import LeagueID
-from cachetools import cached
-from data.utils import load_data, save_data, retry, cache
+from utils.data import load_data, save_data, retry, ttl_cache
 
 # from nba_api.stats.endpoints import FranchiseHistory
 
@@ -27,7 +25,7 @@ class TeamData(object):
         self.metadata = self.get_team_metadata()
         self.team_id_map = self.get_team_id_map()
         self.team_name_map = self.get_team_name_map()
-        self.all_team_ids = list(np.unique(list(self.team_id_map.values())))
+        self.all_team_ids = sorted(set(self.team_id_map.values()))
         self.league_id = LeagueID.nba
         """self.franchise_history = (
             FranchiseHistory().get_data_frames()[0].drop(columns=["LEAGUE_ID"])
@@ -61,7 +59,7 @@ class TeamData(object):
         """
         return load_data(pth=os.path.join(self._raw_folder, "team_metadata.pickle"))  # type: ignore
 
-    @cached(cache)
+    @ttl_cache()
     @retry
     def _retrieve_team_metadata(self) -> List[Dict[str, Any]]:
         """Retrieve NBA team metadata from nba_api.
@@ -2,14 +2,13 @@
 # Imports
 import os
 from concurrent.futures import ThreadPoolExecutor
-from cachetools import cached
 from typing import List, Literal, Union
 from tqdm import tqdm
 import numpy as np
 import pandas as pd
 from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.library.parameters import LeagueID, SeasonType
-from data.utils import save_data, retry, cache
+from utils.data import save_data, retry, ttl_cache
 from data.teams.team_data import TeamData
 from features.team_stats import TeamStats
 
@@ -56,7 +55,7 @@ class TeamGameData(TeamData):
             print(e)
             return None
 
-    @cached(cache)
+    @ttl_cache()
     @retry
     def _retrieve_team_games(
         self, team_id: int, season_type: str = SeasonType.regular
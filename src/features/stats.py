@@ -1,10 +1,349 @@
 """Compute statistics for NBA data."""
-from typing import List
+from typing import Callable, Dict, Iterable, List, Tuple
+from collections import Counter, defaultdict
+import ast
+import functools
 import inspect
+import threading
 import numpy as np
+import pandas as pd
 from numpy.typing import ArrayLike
 
 
+_SCALAR_TYPES = frozenset({int, float, type(None)})
+_EMPTY = np.empty(0)  # Shared read-only result of not yet implemented stats
+_EMPTY.flags.writeable = False
+_dispatch_state = threading.local()  # .active: inside a _scalar_or_array stat call
+
+
+def _scalar_or_array(stat_method: Callable) -> Callable:
+    """
+    Dispatch stat method inputs to pure Python or NumPy arithmetic.
+
+    Python scalars (single game/season queries) and unset optional inputs are left
+    untouched so the method body runs as plain float arithmetic instead of paying
+    ufunc dispatch overhead. Everything else (lists, Series, ndarrays) is cast once
+    to a C-contiguous array of the instance's array module and float precision
+    (self.xp, self.dtype) so the same operators stream over unit-stride memory
+    without upcasting, and array shapes are checked to broadcast up front. A scalar
+    ZeroDivisionError falls back to NumPy semantics (inf/nan) to match array
+    inputs.
+
+    Only the outermost stat call coerces and checks its inputs: helpers it calls
+    (e.g. _qAST inside offensive_rating) receive already coerced values and run
+    their bodies directly, so a composite stat pays the dispatch overhead once.
+
+    Args:
+        stat_method (Callable): stat method whose body only uses arithmetic operators.
+
+    Returns:
+        Callable: wrapped stat method.
+
+    Raises:
+        ValueError: array inputs have shapes that do not broadcast together.
+    """
+    stat_params = frozenset(inspect.signature(stat_method).parameters)
+
+    @functools.wraps(stat_method)
+    def wrapper(self, **kwargs):
+        if getattr(_dispatch_state, "active", False):
+            return stat_method(self, **kwargs)
+        _dispatch_state.active = True
+        try:
+            return dispatch(self, kwargs)
+        finally:
+            _dispatch_state.active = False
+
+    def dispatch(self, kwargs):
+        arrays = {
+            k: self.xp.asarray(v, dtype=self.dtype, order="C")
+            for k, v in kwargs.items()
+            if type(v) not in _SCALAR_TYPES  # Hash lookup short-circuits plain scalars
+            and k in stat_params
+            and not isinstance(v, (int, float))
+        }
+        if arrays:  # Scalar-only calls skip coercion and shape checks entirely
+            kwargs.update(arrays)
+            shapes = {k: v.shape for k, v in arrays.items()}
+            try:
+                np.broadcast_shapes(*shapes.values())
+            except ValueError:
+                raise ValueError(
+                    f"{stat_method.__name__} inputs do not broadcast together: {shapes}"
+                ) from None
+        try:
+            return stat_method(self, **kwargs)
+        except ZeroDivisionError:
+            return stat_method(
+                self,
+                **{
+                    k: np.float64(v) if isinstance(v, (int, float)) else v
+                    for k, v in kwargs.items()
+                },
+            )
+
+    wrapper.__signature__ = inspect.signature(stat_method)  # type: ignore
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _stat_params(stat_func: Callable) -> Tuple[Tuple[str, bool], ...]:
+    """
+    Inspect a stat function's parameters once per function object.
+
+    Args:
+        stat_func (Callable): plain (unbound) stat function.\n
+
+    Returns:
+        Tuple[Tuple[str, bool], ...]: (parameter name, required) pairs, excluding
+            self and **kwargs.
+    """
+    return tuple(
+        (param.name, param.default is param.empty)
+        for param in inspect.signature(stat_func).parameters.values()
+        if param.name != "self" and param.kind is not param.VAR_KEYWORD
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _required_stat_params(stat_funcs: Tuple[Callable, ...]) -> Tuple[str, ...]:
+    """
+    Collect the required parameters of stat functions once per set of functions.
+
+    Args:
+        stat_funcs (Tuple[Callable, ...]): plain (unbound) stat functions.\n
+
+    Returns:
+        Tuple[str, ...]: sorted names of parameters without a default.
+    """
+    return tuple(
+        sorted(
+            {
+                name
+                for stat_func in stat_funcs
+                for name, required in _stat_params(stat_func)
+                if required
+            }
+        )
+    )
+
+
+def _hoist_common_subexpressions(
+    trees: List[ast.expr], expressions: List[str]
+) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    Common-subexpression elimination across a set of stat expressions.
+
+    Every operation appearing more than once inside the expressions is bound to a
+    local variable, innermost first, and its occurrences are replaced by that name.
+    Divisors shared by several divisions (e.g. FGA) are inverted once, and those
+    divisions become multiplications by the reciprocal.
+
+    Args:
+        trees (List[ast.expr]): parsed expressions.\n
+        expressions (List[str]): source of each expression, in the same order.\n
+
+    Returns:
+        Tuple[List[Tuple[str, str]], List[str]]: (local name, expression) assignments
+            in evaluation order, and the expressions rewritten to use those names.
+    """
+    counts = Counter(
+        ast.dump(node)
+        for tree in trees
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.BinOp, ast.UnaryOp))
+    )
+    root_counts = Counter(ast.dump(tree) for tree in trees)
+    divisors = Counter(
+        ast.dump(node.right)
+        for tree in trees
+        for node in ast.walk(tree)
+        if isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.Div)
+        and not isinstance(node.right, ast.Constant)
+    )
+    hoisted: Dict[str, str] = {}  # ast.dump of a shared operation -> local name
+    assignments: List[Tuple[str, str]] = []
+
+    def reciprocal(node: ast.expr, source: str) -> str:
+        key = f"1 / {ast.dump(node)}"
+        if key not in hoisted:
+            text = rewrite(node, source)
+            hoisted[key] = f"_cse{len(assignments)}"
+            assignments.append((hoisted[key], f"1 / ({text})"))
+        return hoisted[key]
+
+    def rewrite(node: ast.expr, source: str, is_root: bool = False) -> str:
+        key = ast.dump(node)
+        if key in hoisted:
+            return hoisted[key]
+        multiply_by_reciprocal = (
+            isinstance(node, ast.BinOp)
+            and isinstance(node.op, ast.Div)
+            and divisors[ast.dump(node.right)] > 1
+        )
+        text, end = "", node.col_offset
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                between = source[end : child.col_offset]
+                if multiply_by_reciprocal and child is node.right:
+                    text += between.replace("/", "*", 1) + reciprocal(child, source)
+                else:
+                    text += between + rewrite(child, source)
+                end = child.end_col_offset
+        text += source[end : node.end_col_offset]
+        # Stats that are also part of another stat are shared too, but identical
+        # stats are not, so that no two outputs are the same array
+        if counts[key] > (root_counts[key] if is_root else 1):
+            hoisted[key] = f"_cse{len(assignments)}"
+            assignments.append((hoisted[key], text))
+            return hoisted[key]
+        return text
+
+    returns = [
+        rewrite(tree, expression, is_root=True)
+        for tree, expression in zip(trees, expressions)
+    ]
+    return assignments, returns
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_expressions(
+    expressions: Tuple[Tuple[str, str], ...]
+) -> Tuple[Callable[..., Tuple[ArrayLike, ...]], Tuple[str, ...]]:
+    """
+    Generate and compile one function evaluating several stat expressions.
+
+    Compiled once per distinct set of expressions and reused for every batch.
+    Subexpressions shared between the stats (e.g. true shooting attempts, used by
+    TS_PCT and both possession estimates) are evaluated once.
+
+    Args:
+        expressions (Tuple[Tuple[str, str], ...]): (stat name, expression) pairs.\n
+
+    Returns:
+        Tuple[Callable[..., Tuple[ArrayLike, ...]], Tuple[str, ...]]: function taking
+            the expressions' input columns as positional arguments and returning the
+            stats in expression order, and the names of those input columns (the
+            argument order).
+    """
+    trees = [ast.parse(expression, mode="eval").body for _, expression in expressions]
+    params = tuple(
+        sorted(
+            {
+                node.id
+                for tree in trees
+                for node in ast.walk(tree)
+                if isinstance(node, ast.Name)
+            }
+        )
+    )
+    assignments, returns = _hoist_common_subexpressions(
+        trees, [expression for _, expression in expressions]
+    )
+    source = "def stat_kernel({}):\n{}    return ({})\n".format(
+        ", ".join(params),
+        "".join(f"    {name} = {value}\n" for name, value in assignments),
+        "".join(f"({expression}), " for expression in returns),
+    )
+    namespace: Dict[str, Callable] = {}
+    exec(compile(source, "<stat_kernel>", "exec"), namespace)
+    return namespace["stat_kernel"], params
+
+
+def _broadcast_spec(*values: ArrayLike) -> Tuple[Tuple[int, ...], np.dtype]:
+    """
+    Shape and (floating point) dtype of an element-wise result of values.
+
+    Args:
+        values (ArrayLike): operands of the element-wise computation; None ignored.\n
+
+    Returns:
+        Tuple[Tuple[int, ...], np.dtype]: broadcast shape and result dtype.
+    """
+    values = tuple(value for value in values if value is not None)
+    shape = np.broadcast_shapes(*(np.shape(value) for value in values))
+    dtype = np.result_type(  # float16 floor: at least a floating point dtype
+        np.float16, *(value.dtype for value in values if hasattr(value, "dtype"))
+    )
+    return shape, dtype
+
+
+def _divide_into(numerator: ArrayLike, denominator: ArrayLike) -> ArrayLike:
+    """
+    Divide by a freshly computed denominator, reusing it to hold the quotient.
+
+    For callers whose denominator (e.g. REB + OPP_REB) is a temporary, this saves
+    allocating a second array. Scalar (including numpy scalar and 0-d) and
+    non-float or broadcast denominators fall back to plain division.
+
+    Args:
+        numerator (ArrayLike): dividend.\n
+        denominator (ArrayLike): divisor, not used again by the caller.\n
+
+    Returns:
+        ArrayLike: quotient.
+    """
+    if (
+        not isinstance(denominator, np.ndarray)
+        or denominator.ndim == 0
+        or denominator.dtype.kind != "f"
+        or np.shape(numerator) not in ((), denominator.shape)
+    ):
+        return numerator / denominator
+    return np.divide(numerator, denominator, out=denominator)
+
+
+def _safe_divide(numerator: ArrayLike, denominator: ArrayLike) -> ArrayLike:
+    """
+    Divide element-wise, yielding 0 wherever the denominator is 0.
+
+    Only lanes with a nonzero denominator are divided (ufunc where=), so games in
+    which a player did not play or attempt a free throw produce 0 rather than
+    inf/nan and no divide-by-zero warnings.
+
+    Args:
+        numerator (ArrayLike): dividend.\n
+        denominator (ArrayLike): divisor.\n
+
+    Returns:
+        ArrayLike: quotient, 0 where denominator is 0.
+    """
+    if isinstance(numerator, (int, float)) and isinstance(denominator, (int, float)):
+        return numerator / denominator if denominator else 0.0
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    quotient = np.zeros_like(
+        numerator, dtype=np.result_type(numerator.dtype, denominator.dtype, np.float32)
+    )
+    np.divide(numerator, denominator, out=quotient, where=denominator != 0)
+    return quotient[()]
+
+
+class _BufferPool(object):
+    """
+    Pool of scratch arrays keyed by (shape, dtype).
+
+    Stat methods borrow a buffer for intermediate results and release it before
+    returning, so repeated calls on same-shaped data (e.g. 82 game seasons) reuse
+    memory instead of allocating a fresh temporary per arithmetic step. Buffers
+    handed back to callers must never come from the pool.
+    """
+
+    def __init__(self, xp=np) -> None:
+        self._xp = xp
+        self._buffers = defaultdict(list)
+
+    def get(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Borrow an uninitialized buffer of the given shape and dtype."""
+        buffers = self._buffers[(shape, np.dtype(dtype))]
+        return buffers.pop() if buffers else self._xp.empty(shape, dtype)
+
+    def release(self, *buffers: np.ndarray) -> None:
+        """Return borrowed buffers to the pool."""
+        for buffer in buffers:
+            self._buffers[(buffer.shape, buffer.dtype)].append(buffer)
+
+
 class Stats(object):
     """
     Class to compute statistics using NBA Team/Player data.
@@ -16,6 +355,10 @@ class Stats(object):
             - https://www.basketball-reference.com/about/glossary.html
             - https://www.nba.com/stats/help/glossary
         - Four Factors: https://www.basketball-reference.com/about/factors.html
+
+    Pass xp=cupy (or any NumPy compatible array module) to compute stats on a GPU.
+    Inputs are cast to dtype (float32 by default, which halves memory traffic);
+    pass dtype=np.float64 for full precision.
     """
 
     def __init__(
@@ -26,13 +369,20 @@ class Stats(object):
         four_factor_turnover_weight: float = 0.25,
         four_factor_rebounding_weight: float = 0.2,
         four_factor_free_throw_weight: float = 0.15,
+        xp=np,
+        dtype=np.float32,
     ) -> None:
-        self._ft_weight = free_throw_weight
-        self._pythagorean_exp = pythagorean_exponent
-        self._four_factor_shooting_weight = four_factor_shooting_weight
-        self._four_factor_turnover_weight = four_factor_turnover_weight
-        self._four_factor_rebounding_weight = four_factor_rebounding_weight
-        self._four_factor_free_throw_weight = four_factor_free_throw_weight
+        self.xp = xp  # Array module: numpy, or a drop-in such as cupy for GPU
+        self.dtype = dtype  # Float precision inputs are cast to
+        # Python floats: scalar fast path, and never upcast float32 arrays (unlike
+        # NumPy float64 scalars under NEP 50)
+        self._ft_weight = float(free_throw_weight)
+        self._pythagorean_exp = float(pythagorean_exponent)
+        self._four_factor_shooting_weight = float(four_factor_shooting_weight)
+        self._four_factor_turnover_weight = float(four_factor_turnover_weight)
+        self._four_factor_rebounding_weight = float(four_factor_rebounding_weight)
+        self._four_factor_free_throw_weight = float(four_factor_free_throw_weight)
+        self._buffer_pool = _BufferPool(xp)
         self.basic_box_score_stats = [
             "PTS",
             "FGM",
@@ -81,8 +431,26 @@ class Stats(object):
             }
         )
         self.dependent_stat_method_map = {}
+        self.stat_expressions = {  # Column expressions for DataFrame.eval
+            "FG_PCT": "FGM / FGA",
+            "FT_PCT": "FTM / FTA",
+            "FG2A": "FGA - FG3A",
+            "FG2M": "FGM - FG3M",
+            "FG2_PCT": "(FGM - FG3M) / (FGA - FG3A)",
+            "2PAr": "(FGA - FG3A) / FGA",
+            "FG3_PCT": "FG3M / FG3A",
+            "3PAr": "FG3A / FGA",
+            "eFG_PCT": "(FGM + 0.5 * FG3M) / FGA",
+            "TS_PCT": f"PTS / (2 * (FGA + {self._ft_weight} * FTA))",
+            "MINOR_POSS": f"FGA + {self._ft_weight} * FTA + TOV",
+            "MAJOR_POSS": f"FGA + {self._ft_weight} * FTA - OREB + TOV",
+        }
+        self.intermediate_stat_method_map = {}  # Shared inputs to other stats
+        self.opponent_stat_method_map = {}  # Team methods applied to opponent data
         self.basic_required_stat_params = self._get_required_stat_params()
+        self.stat_graph = self._build_stat_graph()
 
+    @_scalar_or_array
     def field_goal_pct(self, FGM: ArrayLike, FGA: ArrayLike, **_) -> ArrayLike:
         """Field goal percentage (FG_PCT).
 
@@ -93,8 +461,9 @@ class Stats(object):
         Returns:
             ArrayLike: field goal percentage
         """
-        return np.divide(FGM, FGA)
+        return FGM / FGA
 
+    @_scalar_or_array
     def free_throw_pct(self, FTM: ArrayLike, FTA: ArrayLike, **_) -> ArrayLike:
         """Free throw percentage (FT_PCT).
 
@@ -105,8 +474,9 @@ class Stats(object):
         Returns:
             ArrayLike: free throw percentage
         """
-        return np.divide(FTM, FTA)
+        return FTM / FTA
 
+    @_scalar_or_array
     def two_point_attempts(self, FGA: ArrayLike, FG3A: ArrayLike, **_) -> ArrayLike:
         """Two point attempts (FG2A).
 
@@ -117,8 +487,9 @@ class Stats(object):
         Returns:
             ArrayLike: two point attempts
         """
-        return np.subtract(FGA, FG3A)
+        return FGA - FG3A
 
+    @_scalar_or_array
     def two_point_makes(self, FGM: ArrayLike, FG3M: ArrayLike, **_) -> ArrayLike:
         """Two point makes (FG2M).
 
@@ -129,8 +500,9 @@ class Stats(object):
         Returns:
             ArrayLike: two point makes
         """
-        return np.subtract(FGM, FG3M)
+        return FGM - FG3M
 
+    @_scalar_or_array
     def two_point_pct(
         self, FGA: ArrayLike, FGM: ArrayLike, FG3A: ArrayLike, FG3M: ArrayLike, **_
     ) -> ArrayLike:
@@ -143,11 +515,18 @@ class Stats(object):
         Returns:
             ArrayLike: two point percentage
         """
-        return np.divide(
-            self.two_point_makes(FGM=FGM, FG3M=FG3M),
-            self.two_point_attempts(FGA=FGA, FG3A=FG3A),
-        )
-
+        shape, dtype = _broadcast_spec(FGA, FGM, FG3A, FG3M)
+        if not shape:  # Scalar and 0-d results cannot be written in place
+            return (FGM - FG3M) / (FGA - FG3A)
+        # Evaluated in place: one output array plus a pooled scratch buffer
+        two_point_pct = np.subtract(FGM, FG3M, out=self.xp.empty(shape, dtype))
+        two_point_attempts = self._buffer_pool.get(shape, dtype)
+        np.subtract(FGA, FG3A, out=two_point_attempts)
+        two_point_pct /= two_point_attempts
+        self._buffer_pool.release(two_point_attempts)
+        return two_point_pct
+
+    @_scalar_or_array
     def two_point_attempt_rate(self, FGA: ArrayLike, FG3A: ArrayLike, **_) -> ArrayLike:
         """
         Two Point Attempt Rate (2PAr)
@@ -162,8 +541,14 @@ class Stats(object):
         Returns:
             ArrayLike: two point attempt rate
         """
-        return np.divide(self.two_point_attempts(FGA=FGA, FG3A=FG3A), FGA)
+        # (FGA - FG3A) / FGA == 1 - FG3A / FGA, evaluated into a single array
+        two_point_attempt_rate = np.divide(FG3A, FGA)
+        if not np.ndim(two_point_attempt_rate):  # Scalar: no array to write to
+            return 1 - two_point_attempt_rate
+        np.subtract(1, two_point_attempt_rate, out=two_point_attempt_rate)
+        return two_point_attempt_rate
 
+    @_scalar_or_array
     def three_point_pct(self, FG3M: ArrayLike, FG3A: ArrayLike, **_) -> ArrayLike:
         """Three point percentage (FG3_PCT).
 
@@ -174,8 +559,9 @@ class Stats(object):
         Returns:
             ArrayLike: three point percentage
         """
-        return np.divide(FG3M, FG3A)
+        return FG3M / FG3A
 
+    @_scalar_or_array
     def three_point_attempt_rate(
         self, FGA: ArrayLike, FG3A: ArrayLike, **_
     ) -> ArrayLike:
@@ -192,8 +578,9 @@ class Stats(object):
         Returns:
             ArrayLike: three point attempt rate
         """
-        return np.divide(FG3A, FGA)
+        return FG3A / FGA
 
+    @_scalar_or_array
     def effective_field_goal_pct(
         self, FGA: ArrayLike, FGM: ArrayLike, FG3M: ArrayLike, **_
     ) -> ArrayLike:
@@ -211,8 +598,29 @@ class Stats(object):
         Returns:
             ArrayLike: effective field goal percentage
         """
-        return np.divide(np.add(np.multiply(FGM, 0.5), FG3M), FGA)
+        return (FGM + 0.5 * FG3M) / FGA
+
+    @_scalar_or_array
+    def effective_field_goal_pct_total(
+        self, FGA: ArrayLike, FGM: ArrayLike, FG3M: ArrayLike, **_
+    ) -> float:
+        """
+        Effective Field Goal Percentage (eFG%) over many games (e.g. a season).
+            eFG% = (sum(FGM) + 0.5*sum(3PM)) / sum(FGA)
+
+        Each column is summed once, so no per-game intermediate array is built.
+
+        Args:
+            FGA (ArrayLike): field goal attempts per game\n
+            FGM (ArrayLike): field goal makes per game\n
+            FG3M (ArrayLike): three point field goal makes per game\n
 
+        Returns:
+            float: aggregate effective field goal percentage
+        """
+        return (np.sum(FGM) + 0.5 * np.sum(FG3M)) / np.sum(FGA)
+
+    @_scalar_or_array
     def minor_possessions(
         self, FGA: ArrayLike, FTA: ArrayLike, TOV: ArrayLike, **_
     ) -> ArrayLike:
@@ -234,8 +642,9 @@ class Stats(object):
         Returns:
             ArrayLike: minor possession estimate
         """
-        return np.sum(np.array([FGA, np.multiply(FTA, self._ft_weight), TOV]), axis=0)
+        return FGA + FTA * self._ft_weight + TOV
 
+    @_scalar_or_array
     def major_possessions(
         self, FGA: ArrayLike, FTA: ArrayLike, TOV: ArrayLike, OREB: ArrayLike, **_
     ) -> ArrayLike:
@@ -256,13 +665,9 @@ class Stats(object):
         Returns:
             ArrayLike: major possession estimate
         """
-        return np.sum(
-            np.array(
-                [FGA, np.multiply(self._ft_weight, FTA), np.multiply(-1, OREB), TOV]
-            ),
-            axis=0,
-        )
+        return FGA + self._ft_weight * FTA - OREB + TOV
 
+    @_scalar_or_array
     def _true_shooting_attempts(self, FGA: ArrayLike, FTA: ArrayLike, **_) -> ArrayLike:
         """
         True Shooting Attempts (TSA)
@@ -275,8 +680,9 @@ class Stats(object):
         Returns:
             ArrayLike: true shooting attempts
         """
-        return np.add(FGA, np.multiply(FTA, self._ft_weight))
+        return FGA + self._ft_weight * FTA
 
+    @_scalar_or_array
     def true_shooting_pct(
         self, PTS: ArrayLike, FGA: ArrayLike, FTA: ArrayLike, **_
     ) -> ArrayLike:
@@ -294,7 +700,27 @@ class Stats(object):
         Returns:
             ArrayLike: true shooting percentage
         """
-        return np.divide(PTS, self._true_shooting_attempts(FGA=FGA, FTA=FTA))
+        return PTS / (2 * self._true_shooting_attempts(FGA=FGA, FTA=FTA))
+
+    @_scalar_or_array
+    def true_shooting_pct_total(
+        self, PTS: ArrayLike, FGA: ArrayLike, FTA: ArrayLike, **_
+    ) -> float:
+        """
+        True Shooting Percentage (TS%) over many games (e.g. a season).
+            TS% = sum(PTS) / (2 * (sum(FGA) + 0.44*sum(FTA)))
+
+        Each column is summed once, so no per-game TSA array is built.
+
+        Args:
+            PTS (ArrayLike): points per game\n
+            FGA (ArrayLike): field goal attempts per game\n
+            FTA (ArrayLike): free throw attempts per game\n
+
+        Returns:
+            float: aggregate true shooting percentage
+        """
+        return np.sum(PTS) / (2 * (np.sum(FGA) + self._ft_weight * np.sum(FTA)))
 
     def _get_required_stat_params(self) -> List[str]:
         """
@@ -304,16 +730,427 @@ class Stats(object):
         Returns:
             List[str]: list of all possible required parameters.
         """
-        all_stat_methods = {
-            **self.independent_stat_method_map,
-            **self.dependent_stat_method_map,
+        return list(
+            _required_stat_params(
+                tuple(
+                    stat_func.__func__
+                    for stat_method_map in [
+                        self.independent_stat_method_map,
+                        self.dependent_stat_method_map,
+                    ]
+                    for stat_func in stat_method_map.values()
+                )
+            )
+        )
+
+    @functools.cached_property
+    def stat_order(self) -> List[str]:
+        """Every statistic this class can compute, dependencies first."""
+        return self._sort_stat_graph(self.stat_graph)
+
+    @staticmethod
+    def _opponent_param(param: str) -> str:
+        """Swap a parameter between team and opponent perspective (PTS <-> OPP_PTS)."""
+        return param[len("OPP_") :] if param.startswith("OPP_") else "OPP_" + param
+
+    def _build_stat_graph(self) -> Dict[str, Tuple[Callable, Dict[str, str]]]:
+        """
+        Build the dependency graph of every statistic this class can compute.
+
+        Each node maps a stat name to its method and the inputs it reads, keyed by
+        method parameter and valued by the data column or stat that feeds it. Stats in
+        opponent_stat_method_map reuse team methods with team/opponent inputs swapped.
+
+        Returns:
+            Dict[str, Tuple[Callable, Dict[str, str]]]: stat name -> (method, inputs).
+        """
+        stat_graph = {}
+        for stat_method_map, opponent in [
+            (self.independent_stat_method_map, False),
+            (self.dependent_stat_method_map, False),
+            (self.intermediate_stat_method_map, False),
+            (self.opponent_stat_method_map, True),
+        ]:
+            for stat_name, stat_func in stat_method_map.items():
+                stat_graph[stat_name] = (
+                    stat_func,
+                    {
+                        name: self._opponent_param(name) if opponent else name
+                        for name, _ in _stat_params(stat_func.__func__)
+                    },
+                )
+        return stat_graph
+
+    def _sort_stat_graph(
+        self, stat_names: Iterable[str], available: Iterable[str] = ()
+    ) -> List[str]:
+        """
+        Topologically sort the stats needed to compute stat_names.
+
+        Stats already available (e.g. provided as data) are treated as leaves, so
+        neither they nor their dependencies are scheduled.
+
+        Args:
+            stat_names (Iterable[str]): statistics to compute.\n
+            available (Iterable[str], optional): columns/stats already computed.\n
+
+        Raises:
+            ValueError: stat graph contains a circular dependency.
+
+        Returns:
+            List[str]: stats in evaluation order, dependencies first.
+        """
+        order, visiting, visited = [], set(), set(available)
+
+        def visit(stat_name: str) -> None:
+            if stat_name in visited or stat_name not in self.stat_graph:
+                return
+            if stat_name in visiting:
+                raise ValueError(f"Circular stat dependency at {stat_name}")
+            visiting.add(stat_name)
+            for source in self.stat_graph[stat_name][1].values():
+                visit(source)
+            visiting.remove(stat_name)
+            visited.add(stat_name)
+            order.append(stat_name)
+
+        for stat_name in stat_names:
+            visit(stat_name)
+        return order
+
+    def to_device(self, data: Dict[str, ArrayLike]) -> Dict[str, ArrayLike]:
+        """
+        Move data columns to the instance's array module once, up front.
+
+        With xp=cupy, columns are copied to the GPU a single time and every stat
+        computed from them (e.g. via compute_stats) then runs on-device, since NumPy
+        ufuncs dispatch to the input arrays' module.
+
+        Args:
+            data (Dict[str, ArrayLike]): data columns named after the NBA API.\n
+
+        Returns:
+            Dict[str, ArrayLike]: same columns as self.dtype arrays of self.xp.
+        """
+        return {
+            name: self.xp.asarray(column, dtype=self.dtype, order="C")
+            for name, column in data.items()
         }
-        all_params = []
-        for stat_func in all_stat_methods.values():
-            all_params.extend(inspect.getfullargspec(stat_func).args)
-        all_params = sorted(np.unique(all_params))
-        all_params.remove("self")
-        return all_params
+
+    def from_device(self, stats: Dict[str, ArrayLike]) -> Dict[str, np.ndarray]:
+        """
+        Copy computed statistics back to host NumPy arrays (e.g. from a GPU).
+
+        Args:
+            stats (Dict[str, ArrayLike]): statistics computed by this instance.\n
+
+        Returns:
+            Dict[str, np.ndarray]: same statistics as NumPy arrays.
+        """
+        asnumpy = getattr(self.xp, "asnumpy", np.asarray)  # cupy.asnumpy
+        return {name: asnumpy(values) for name, values in stats.items()}
+
+    def stack_to_soa(self, records: Iterable[Dict[str, float]]) -> Dict[str, ArrayLike]:
+        """
+        Convert per-player/per-game records (e.g. rows of API JSON) into columns.
+
+        Each field becomes one contiguous self.dtype array (struct of arrays), built
+        in a single pass over the records, so every stat then streams over unit-stride
+        memory instead of picking fields out of individual records.
+
+        Args:
+            records (Iterable[Dict[str, float]]): records sharing the same fields,
+                named after the NBA API.\n
+
+        Returns:
+            Dict[str, ArrayLike]: one array per field, ready for compute_stats or any
+                stat method (**columns).
+        """
+        records = list(records)
+        fields = records[0].keys() if records else ()
+        return self.to_device(
+            {
+                name: np.fromiter(
+                    (record[name] for record in records),
+                    dtype=self.dtype,
+                    count=len(records),
+                )
+                for name in fields
+            }
+        )
+
+    def compute_stats(
+        self, stat_names: Iterable[str], data: Dict[str, ArrayLike]
+    ) -> Dict[str, ArrayLike]:
+        """
+        Compute requested statistics in a single pass over the stat graph.
+
+        Every intermediate (e.g. OREB_PCT, TEAM_POSS, POSS) is evaluated exactly once
+        and shared by all stats that depend on it, instead of each stat recomputing
+        its own inputs.
+        Floating-point error checks are switched off once for the whole pass, so
+        games with zero attempts give NaN instead of warning per division.
+
+        Args:
+            stat_names (Iterable[str]): statistics to compute.\n
+            data (Dict[str, ArrayLike]): data columns named after the NBA API.\n
+
+        Raises:
+            ValueError: unknown statistic requested.
+
+        Returns:
+            Dict[str, ArrayLike]: requested statistics keyed by name.
+        """
+        stat_names = list(stat_names)
+        unknown_stats = set(stat_names).difference(self.stat_graph, data)
+        if unknown_stats:
+            raise ValueError(f"Unknown statistics: {sorted(unknown_stats)}")
+        cache = dict(data)
+        stat_order = self._sort_stat_graph(stat_names, available=cache)
+        cache.update(  # Cast each input column once rather than in every stat
+            {
+                src: self.xp.asarray(data[src], dtype=self.dtype, order="C")
+                for stat_name in stat_order
+                for src in self.stat_graph[stat_name][1].values()
+                if src in data
+            }
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for stat_name in stat_order:
+                stat_func, inputs = self.stat_graph[stat_name]
+                cache[stat_name] = stat_func(
+                    **{
+                        param: cache[src]
+                        for param, src in inputs.items()
+                        if src in cache
+                    }
+                )
+        return {stat_name: cache[stat_name] for stat_name in stat_names}
+
+    def compile_stats(
+        self, stat_names: Iterable[str]
+    ) -> Callable[[Dict[str, ArrayLike]], Dict[str, ArrayLike]]:
+        """
+        Specialize stat computation for a fixed set of statistics.
+
+        Stats with an entry in stat_expressions are composed into a single generated
+        function, compiled once and cached, so repeated batches skip per-stat method
+        dispatch and input coercion. With xp=cupy that function is also fused
+        (cupy.fuse) into one GPU kernel instead of a kernel launch per operation.
+        Remaining stats go through compute_stats.
+
+        Args:
+            stat_names (Iterable[str]): statistics to compute.\n
+
+        Returns:
+            Callable[[Dict[str, ArrayLike]], Dict[str, ArrayLike]]: function mapping
+                data columns named after the NBA API to the requested statistics.
+        """
+        stat_names = list(stat_names)
+        expr_names = [name for name in stat_names if name in self.stat_expressions]
+        stat_kernel, params = _compile_expressions(
+            tuple((name, self.stat_expressions[name]) for name in expr_names)
+        )
+        fuse = getattr(self.xp, "fuse", None)  # cupy.fuse; NumPy has no equivalent
+        if fuse is not None and expr_names:
+            stat_kernel = fuse(stat_kernel)
+        method_names = [
+            name for name in stat_names if name not in self.stat_expressions
+        ]
+
+        def compute(data: Dict[str, ArrayLike]) -> Dict[str, ArrayLike]:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stats = dict(
+                    zip(
+                        expr_names,
+                        stat_kernel(
+                            *(
+                                self.xp.asarray(data[name], dtype=self.dtype, order="C")
+                                for name in params
+                            )
+                        ),
+                    )
+                )
+            if method_names:
+                stats.update(self.compute_stats(method_names, data))
+            return {stat_name: stats[stat_name] for stat_name in stat_names}
+
+        return compute
+
+    def _frame_columns(
+        self, df: pd.DataFrame, stat_names: Iterable[str]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Pull only the DataFrame columns that stat_names read out as NumPy arrays.
+
+        The columns are extracted and cast to dtype in a single to_numpy pass, as the
+        contiguous rows of one 2D array.
+
+        Args:
+            df (pd.DataFrame): box score data with columns named after the NBA API.\n
+            stat_names (Iterable[str]): statistics to compute.\n
+
+        Returns:
+            Dict[str, np.ndarray]: input columns keyed by name.
+        """
+        stat_names = list(stat_names)
+        columns = {name for name in stat_names if name in df.columns}.union(
+            src
+            for stat_name in self._sort_stat_graph(stat_names, available=df.columns)
+            for src in self.stat_graph[stat_name][1].values()
+            if src in df.columns
+        )
+        names = [name for name in df.columns if name in columns]
+        return dict(zip(names, df[names].to_numpy(self.dtype, na_value=np.nan).T))
+
+    @staticmethod
+    def _stats_frame(stats: Dict[str, np.ndarray], index: pd.Index) -> pd.DataFrame:
+        """
+        Wrap computed statistics in a DataFrame backed by a single 2D block.
+
+        Each stat is copied once into its column of one preallocated column-major
+        array, which pandas then adopts without copying or consolidating.
+
+        Args:
+            stats (Dict[str, np.ndarray]): statistics keyed by name.\n
+            index (pd.Index): row index of the result.\n
+
+        Returns:
+            pd.DataFrame: statistics as columns.
+        """
+        block = np.empty(
+            (len(index), len(stats)),
+            dtype=np.result_type(np.float32, *stats.values()),
+            order="F",
+        )
+        for i, values in enumerate(stats.values()):
+            block[:, i] = values
+        return pd.DataFrame(block, index=index, columns=list(stats), copy=False)
+
+    def compute_all(self, df: pd.DataFrame, stat_names: Iterable[str]) -> pd.DataFrame:
+        """
+        Compute statistics for every row of a DataFrame of box score data.
+
+        Only the columns the stats read are pulled out as NumPy arrays, once, and
+        handed to compute_stats, so each intermediate is evaluated a single time for
+        the whole table (e.g. OffRtg for a full player season) rather than per row
+        or per stat.
+
+        Args:
+            df (pd.DataFrame): box score data with columns named after the NBA API.\n
+            stat_names (Iterable[str]): statistics to compute.\n
+
+        Returns:
+            pd.DataFrame: requested statistics as columns, indexed like df.
+        """
+        stat_names = list(stat_names)
+        data = self._frame_columns(df, stat_names)
+        return self._stats_frame(
+            self.from_device(self.compute_stats(stat_names, data)), df.index
+        )
+
+    def compute_grouped(
+        self,
+        df: pd.DataFrame,
+        stat_names: Iterable[str],
+        group_keys: Iterable[str] = ("GAME_ID", "TEAM_ID"),
+    ) -> pd.DataFrame:
+        """
+        Compute statistics for player rows, evaluating team-level terms once per team.
+
+        TEAM_ and OPP_ columns are constant within a team-game, so every stat that
+        only depends on them (e.g. TEAM_SCORING_POSS, TEAM_OREB_WEIGHT) is computed on
+        one row per group and broadcast back to the player rows before computing the
+        remaining stats.
+
+        Args:
+            df (pd.DataFrame): box score data with columns named after the NBA API.\n
+            stat_names (Iterable[str]): statistics to compute.\n
+            group_keys (Iterable[str], optional): columns identifying a team-game.
+                Defaults to ("GAME_ID", "TEAM_ID").\n
+
+        Returns:
+            pd.DataFrame: requested statistics as columns, indexed like df.
+        """
+        stat_names = list(stat_names)
+        group_codes = (  # dropna=False: rows with a missing key form their own group
+            df.groupby(list(group_keys), sort=False, dropna=False).ngroup().to_numpy()
+        )
+        first_rows = np.unique(group_codes, return_index=True)[1]
+        group_level = {
+            name for name in df.columns if name.startswith(("TEAM_", "OPP_"))
+        }
+        group_stats = []
+        for stat_name in self._sort_stat_graph(stat_names, available=df.columns):
+            sources = [
+                src
+                for src in self.stat_graph[stat_name][1].values()
+                if src in df.columns or src in self.stat_graph
+            ]
+            if sources and group_level.issuperset(sources):
+                group_level.add(stat_name)
+                group_stats.append(stat_name)
+        data = self._frame_columns(df, stat_names)
+        if group_stats:
+            group_data = {
+                name: data[name][first_rows] for name in group_level if name in data
+            }
+            group_codes = self.xp.asarray(group_codes)  # Broadcast on the device
+            data.update(
+                {
+                    name: self.xp.asarray(values)[group_codes]
+                    for name, values in self.compute_stats(
+                        group_stats, group_data
+                    ).items()
+                }
+            )
+        return self._stats_frame(
+            self.from_device(self.compute_stats(stat_names, data)), df.index
+        )
+
+    def assign_stats(self, df: pd.DataFrame, stat_names: Iterable[str]) -> pd.DataFrame:
+        """
+        Add statistics as columns to a DataFrame of box score data.
+
+        Stats with an entry in stat_expressions are evaluated together in a single
+        DataFrame.eval call (numexpr engine when installed), which avoids allocating
+        a temporary array per arithmetic step. Remaining stats go through
+        compute_stats.
+
+        Args:
+            df (pd.DataFrame): box score data with columns named after the NBA API.\n
+            stat_names (Iterable[str]): statistics to add.\n
+
+        Returns:
+            pd.DataFrame: copy of df with the requested statistics added.
+        """
+        stat_names = list(stat_names)
+        expr_names = [name for name in stat_names if name in self.stat_expressions]
+        # Assignment targets must be identifiers (e.g. not "2PAr"), so alias them
+        targets = {
+            name if name.isidentifier() else f"_STAT_{i}": name
+            for i, name in enumerate(expr_names)
+        }
+        df = (
+            df.eval(
+                "\n".join(
+                    f"{target} = {self.stat_expressions[name]}"
+                    for target, name in targets.items()
+                )
+            ).rename(columns=targets)
+            if targets
+            else df.copy()
+        )
+        method_names = [name for name in stat_names if name not in targets.values()]
+        if method_names:
+            df = df.assign(
+                **self.from_device(
+                    self.compute_stats(
+                        method_names, self._frame_columns(df, method_names)
+                    )
+                )
+            )
+        return df
 
 
 class TeamStats(Stats):
@@ -331,6 +1168,8 @@ class TeamStats(Stats):
         four_factor_turnover_weight: float = 0.25,
         four_factor_rebounding_weight: float = 0.2,
         four_factor_free_throw_weight: float = 0.15,
+        xp=np,
+        dtype=np.float32,
     ) -> None:
         super().__init__(
             free_throw_weight=free_throw_weight,
@@ -339,6 +1178,8 @@ class TeamStats(Stats):
             four_factor_rebounding_weight=four_factor_rebounding_weight,
             four_factor_shooting_weight=four_factor_shooting_weight,
             four_factor_turnover_weight=four_factor_turnover_weight,
+            xp=xp,
+            dtype=dtype,
         )
         self.basic_box_score_cum_stats += [
             "TOV_PCT",
@@ -354,6 +1195,46 @@ class TeamStats(Stats):
                 "FT_FACTOR": self.free_throw_factor,
             }
         )
+        exp = self._pythagorean_exp
+        self.stat_expressions.update(
+            {
+                "TOV_PCT": f"TOV / (FGA + {self._ft_weight} * FTA + TOV)",
+                "SHOOTING_FACTOR": self.stat_expressions["eFG_PCT"],
+                "TOV_FACTOR": f"TOV / (FGA + {self._ft_weight} * FTA + TOV)",
+                "FT_FACTOR": "FTM / FGA",
+                "PLUS_MINUS": "PTS - OPP_PTS",
+                "REB_PCT": "REB / (REB + OPP_REB)",
+                "DREB_PCT": "DREB / (DREB + OPP_OREB)",
+                "OREB_PCT": "OREB / (OREB + OPP_DREB)",
+                "PYTHAG_WINS": f"1 / (1 + (OPP_PTS / PTS) ** {exp})",  # One pow
+                "REB_FACTOR": "REB / (REB + OPP_REB)",
+            }
+        )
+        self.stat_expressions["FOUR_FACTOR_SCORE"] = " + ".join(  # One fused pass
+            f"{weight} * {self.stat_expressions[factor]}"
+            for factor, weight in (
+                ("SHOOTING_FACTOR", self._four_factor_shooting_weight),
+                ("TOV_FACTOR", self._four_factor_turnover_weight),
+                ("REB_FACTOR", self._four_factor_rebounding_weight),
+                ("FT_FACTOR", self._four_factor_free_throw_weight),
+            )
+        )
+        team_poss = (  # TEAM_POSS from {t}eam or {o}pponent perspective
+            "{t}FGA + {w} * {t}FTA - 1.07 * ({t}OREB / ({t}OREB + {o}DREB))"
+            " * ({t}FGA - {t}FGM) + {t}TOV"
+        )
+        poss = "0.5 * (({}) + ({}))".format(
+            team_poss.format(t="", o="OPP_", w=self._ft_weight),
+            team_poss.format(t="OPP_", o="", w=self._ft_weight),
+        )
+        self.stat_expressions.update(  # Inlined; compile_stats evaluates POSS once
+            {
+                "POSS": poss,
+                "PACE": f"({poss}) * (240 / MP)",
+                "OFF_RATING": f"100.0 * PTS / ({poss})",
+                "DEF_RATING": f"100.0 * OPP_PTS / ({poss})",
+            }
+        )
         self.dependent_stat_method_map = {  # Track methods which require opponent data
             "PLUS_MINUS": self.plus_minus,
             "REB_PCT": self.rebound_pct,
@@ -367,8 +1248,16 @@ class TeamStats(Stats):
             "OFF_RATING": self.offensive_rating,
             "DEF_RATING": self.defensive_rating,
         }
+        self.intermediate_stat_method_map = {"TEAM_POSS": self._team_possessions}
+        self.opponent_stat_method_map = {  # Same methods, opponent's perspective
+            "OPP_OREB_PCT": self.offensive_rebound_pct,
+            "OPP_TEAM_POSS": self._team_possessions,
+            "OPP_POSS": self.possessions,
+        }
         self.all_required_stat_params = self._get_required_stat_params()
+        self.stat_graph = self._build_stat_graph()
 
+    @_scalar_or_array
     def plus_minus(self, PTS: ArrayLike, OPP_PTS: ArrayLike, **_) -> ArrayLike:
         """Plus Minus (PLUS_MINUS)
             PLUS_MINUS = PTS - OPP_PTS
@@ -379,8 +1268,9 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: team point differential
         """
-        return np.subtract(PTS, OPP_PTS)
+        return PTS - OPP_PTS
 
+    @_scalar_or_array
     def rebound_pct(self, REB: ArrayLike, OPP_REB: ArrayLike, **_) -> ArrayLike:
         """
         Rebounding Percentage (REB%)
@@ -395,8 +1285,9 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: percentage of rebounds a team grabbed while on the floor.
         """
-        return np.divide(REB, np.add(REB, OPP_REB))
+        return _divide_into(REB, REB + OPP_REB)
 
+    @_scalar_or_array
     def defensive_rebound_pct(
         self, DREB: ArrayLike, OPP_OREB: ArrayLike, **_
     ) -> ArrayLike:
@@ -413,8 +1304,9 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: defensive rebounding rate
         """
-        return np.divide(DREB, np.add(DREB, OPP_OREB))
+        return _divide_into(DREB, DREB + OPP_OREB)
 
+    @_scalar_or_array
     def offensive_rebound_pct(
         self, OREB: ArrayLike, OPP_DREB: ArrayLike, **_
     ) -> ArrayLike:
@@ -431,8 +1323,9 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: offensive rebounding rate
         """
-        return np.divide(OREB, np.add(OREB, OPP_DREB))
+        return _divide_into(OREB, OREB + OPP_DREB)
 
+    @_scalar_or_array
     def turnover_pct(
         self, FGA: ArrayLike, FTA: ArrayLike, TOV: ArrayLike, **_
     ) -> ArrayLike:
@@ -450,8 +1343,9 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: turnover rate
         """
-        return np.divide(TOV, self.minor_possessions(FGA=FGA, FTA=FTA, TOV=TOV))
+        return _divide_into(TOV, self.minor_possessions(FGA=FGA, FTA=FTA, TOV=TOV))
 
+    @_scalar_or_array
     def pythagorean_win_pct(self, PTS: ArrayLike, OPP_PTS: ArrayLike, **_) -> ArrayLike:
         """
         Pythagorean Expected Win Percentage
@@ -469,14 +1363,10 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: team expected win percentage
         """
-        return np.divide(
-            np.power(PTS, self._pythagorean_exp),
-            np.add(
-                np.power(PTS, self._pythagorean_exp),
-                np.power(OPP_PTS, self._pythagorean_exp),
-            ),
-        )
+        # Equivalent ratio form; PTS**exp overflows float32 for season totals
+        return 1 / (1 + (OPP_PTS / PTS) ** self._pythagorean_exp)
 
+    @_scalar_or_array
     def shooting_factor(
         self, FGA: ArrayLike, FGM: ArrayLike, FG3M: ArrayLike, **_
     ) -> ArrayLike:
@@ -493,6 +1383,7 @@ class TeamStats(Stats):
         """
         return self.effective_field_goal_pct(FGM=FGM, FG3M=FG3M, FGA=FGA)
 
+    @_scalar_or_array
     def turnover_factor(
         self, TOV: ArrayLike, FGA: ArrayLike, FTA: ArrayLike, **_
     ) -> ArrayLike:
@@ -509,6 +1400,7 @@ class TeamStats(Stats):
         """
         return self.turnover_pct(TOV=TOV, FGA=FGA, FTA=FTA)
 
+    @_scalar_or_array
     def rebound_factor(self, REB: ArrayLike, OPP_REB: ArrayLike, **_) -> ArrayLike:
         """
         Dean Oliver's Rebound Factor.
@@ -523,6 +1415,7 @@ class TeamStats(Stats):
         """
         return self.rebound_pct(REB=REB, OPP_REB=OPP_REB)
 
+    @_scalar_or_array
     def free_throw_factor(self, FTM: ArrayLike, FGA: ArrayLike, **_) -> ArrayLike:
         """
         Dean Oliver's Free Throw Factor.
@@ -538,8 +1431,9 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: Free Throw Factor.
         """
-        return np.divide(FTM, FGA)
+        return FTM / FGA
 
+    @_scalar_or_array
     def four_factor_score(
         self,
         FGA: ArrayLike,
@@ -550,6 +1444,10 @@ class TeamStats(Stats):
         REB: ArrayLike,
         OPP_REB: ArrayLike,
         TOV: ArrayLike,
+        SHOOTING_FACTOR: ArrayLike = None,
+        TOV_FACTOR: ArrayLike = None,
+        REB_FACTOR: ArrayLike = None,
+        FT_FACTOR: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -566,24 +1464,49 @@ class TeamStats(Stats):
             REB (ArrayLike): rebounds\n
             OPP_REB (ArrayLike): opponent rebounds against\n
             TOV (ArrayLike): turnovers\n
+            SHOOTING_FACTOR (ArrayLike, optional): precomputed shooting factor.\n
+            TOV_FACTOR (ArrayLike, optional): precomputed turnover factor.\n
+            REB_FACTOR (ArrayLike, optional): precomputed rebound factor.\n
+            FT_FACTOR (ArrayLike, optional): precomputed free throw factor.\n
 
         Returns:
             ArrayLike: Four Factor Score.
         """
-        shooting_factor = self.shooting_factor(FGM=FGM, FG3M=FG3M, FGA=FGA)
-        turnover_factor = self.turnover_factor(TOV=TOV, FGA=FGA, FTA=FTA)
-        rebound_factor = self.rebound_factor(REB=REB, OPP_REB=OPP_REB)
-        free_throw_factor = self.free_throw_factor(FTM=FTM, FGA=FGA)
-        return np.sum(
-            [
-                np.multiply(shooting_factor, self._four_factor_shooting_weight),
-                np.multiply(turnover_factor, self._four_factor_turnover_weight),
-                np.multiply(rebound_factor, self._four_factor_rebounding_weight),
-                np.multiply(free_throw_factor, self._four_factor_free_throw_weight),
-            ],
-            axis=0,
-        )
-
+        shooting_factor = (
+            self.shooting_factor(FGM=FGM, FG3M=FG3M, FGA=FGA)
+            if SHOOTING_FACTOR is None
+            else SHOOTING_FACTOR
+        )
+        turnover_factor = (
+            self.turnover_factor(TOV=TOV, FGA=FGA, FTA=FTA)
+            if TOV_FACTOR is None
+            else TOV_FACTOR
+        )
+        rebound_factor = (
+            self.rebound_factor(REB=REB, OPP_REB=OPP_REB)
+            if REB_FACTOR is None
+            else REB_FACTOR
+        )
+        free_throw_factor = (
+            self.free_throw_factor(FTM=FTM, FGA=FGA) if FT_FACTOR is None else FT_FACTOR
+        )
+        shape, dtype = _broadcast_spec(
+            shooting_factor, turnover_factor, rebound_factor, free_throw_factor
+        )
+        if not shape:  # Scalar and 0-d results cannot be accumulated in place
+            score = shooting_factor * self._four_factor_shooting_weight
+        else:  # Sized for every factor, any of which may broadcast the others
+            score = np.multiply(
+                shooting_factor,
+                self._four_factor_shooting_weight,
+                out=self.xp.empty(shape, dtype),
+            )
+        score += turnover_factor * self._four_factor_turnover_weight
+        score += rebound_factor * self._four_factor_rebounding_weight
+        score += free_throw_factor * self._four_factor_free_throw_weight
+        return score
+
+    @_scalar_or_array
     def _team_possessions(
         self,
         FGA: ArrayLike,
@@ -592,6 +1515,7 @@ class TeamStats(Stats):
         OREB: ArrayLike,
         OPP_DREB: ArrayLike,
         TOV: ArrayLike,
+        OREB_PCT: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -607,28 +1531,36 @@ class TeamStats(Stats):
             OREB (ArrayLike): offensive rebounds
             OPP_DREB (ArrayLike): opponent defensive rebounds
             TOV (ArrayLike): turnovers
+            OREB_PCT (ArrayLike, optional): precomputed offensive rebound percentage.
 
         Returns:
             ArrayLike: estimate of team # possessions
         """
-        return np.sum(
-            np.array(
-                [
-                    FGA,
-                    np.multiply(self._ft_weight, FTA),
-                    np.multiply(
-                        -1.07,
-                        np.multiply(
-                            self.offensive_rebound_pct(OREB=OREB, OPP_DREB=OPP_DREB),
-                            np.subtract(FGA, FGM),
-                        ),
-                    ),
-                    TOV,
-                ]
-            ),
-            axis=0,
-        )
-
+        shape, dtype = _broadcast_spec(FGA, FGM, FTA, OREB, OPP_DREB, TOV, OREB_PCT)
+        if not shape:  # Scalar and 0-d results cannot be written in place
+            oreb_pct = OREB / (OREB + OPP_DREB) if OREB_PCT is None else OREB_PCT
+            return FGA + self._ft_weight * FTA - 1.07 * oreb_pct * (FGA - FGM) + TOV
+        # Result buffer; accumulated in place
+        team_poss = np.multiply(FTA, self._ft_weight, out=self.xp.empty(shape, dtype))
+        team_poss += FGA
+        oreb_poss = self._buffer_pool.get(shape, dtype)
+        np.subtract(FGA, FGM, out=oreb_poss)
+        oreb_poss *= 1.07
+        if OREB_PCT is None:  # OREB% = OREB * (1 / (OREB + OPP_DREB)), no division
+            oreb_chances = self._buffer_pool.get(shape, dtype)
+            np.add(OREB, OPP_DREB, out=oreb_chances)
+            np.reciprocal(oreb_chances, out=oreb_chances)
+            oreb_poss *= oreb_chances
+            oreb_poss *= OREB
+            self._buffer_pool.release(oreb_chances)
+        else:
+            oreb_poss *= OREB_PCT
+        team_poss -= oreb_poss
+        team_poss += TOV
+        self._buffer_pool.release(oreb_poss)
+        return team_poss
+
+    @_scalar_or_array
     def possessions(
         self,
         FGA: ArrayLike,
@@ -643,6 +1575,8 @@ class TeamStats(Stats):
         OPP_OREB: ArrayLike,
         OPP_DREB: ArrayLike,
         OPP_TOV: ArrayLike,
+        TEAM_POSS: ArrayLike = None,
+        OPP_TEAM_POSS: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -670,27 +1604,30 @@ class TeamStats(Stats):
             OPP_OREB (ArrayLike): opponent offensive rebounds\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
             OPP_TOV (ArrayLike): opponent turnovers\n
+            TEAM_POSS (ArrayLike, optional): precomputed team possession estimate.\n
+            OPP_TEAM_POSS (ArrayLike, optional): precomputed opponent estimate.\n
 
         Returns:
             ArrayLike: possessions as
         """
-        return np.multiply(
-            0.5,
-            np.add(
-                self._team_possessions(
-                    FGA=FGA, FGM=FGM, FTA=FTA, OREB=OREB, OPP_DREB=OPP_DREB, TOV=TOV
-                ),
-                self._team_possessions(
-                    FGA=OPP_FGA,
-                    FGM=OPP_FGM,
-                    FTA=OPP_FTA,
-                    OREB=OPP_OREB,
-                    OPP_DREB=DREB,
-                    TOV=OPP_TOV,
-                ),
-            ),
-        )
-
+        if TEAM_POSS is None:
+            TEAM_POSS = self._team_possessions(
+                FGA=FGA, FGM=FGM, FTA=FTA, OREB=OREB, OPP_DREB=OPP_DREB, TOV=TOV
+            )
+        if OPP_TEAM_POSS is None:
+            OPP_TEAM_POSS = self._team_possessions(
+                FGA=OPP_FGA,
+                FGM=OPP_FGM,
+                FTA=OPP_FTA,
+                OREB=OPP_OREB,
+                OPP_DREB=DREB,
+                TOV=OPP_TOV,
+            )
+        poss = TEAM_POSS + OPP_TEAM_POSS
+        poss *= 0.5
+        return poss
+
+    @_scalar_or_array
     def espn_possessions(
         self, FGA: ArrayLike, FTA: ArrayLike, OREB: ArrayLike, TOV: ArrayLike, **_
     ) -> ArrayLike:
@@ -710,10 +1647,11 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: team possessions according to NBA/ESPN.com.
         """
-        return np.divide(
-            self.major_possessions(FGA=FGA, FTA=FTA, TOV=TOV, OREB=OREB), 2
-        )
+        poss = self.major_possessions(FGA=FGA, FTA=FTA, TOV=TOV, OREB=OREB)
+        poss *= 0.5  # Halve the fresh result in place
+        return poss
 
+    @_scalar_or_array
     def nylon_calculus_possessions(
         self, FGA: ArrayLike, FT_TRIPS: ArrayLike, OREB: ArrayLike, TOV: ArrayLike, **_
     ) -> ArrayLike:
@@ -733,10 +1671,13 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: team possessions according to nylon calculus.
         """
-        return np.divide(
-            np.sum(np.array([FGA, FT_TRIPS, np.multiply(-1, OREB), TOV]), axis=0), 2
-        )
+        poss = FGA + FT_TRIPS  # Only new buffer; the rest accumulate into it in place
+        poss -= OREB
+        poss += TOV
+        poss *= 0.5
+        return poss
 
+    @_scalar_or_array
     def pace(
         self,
         FGA: ArrayLike,
@@ -752,7 +1693,9 @@ class TeamStats(Stats):
         OPP_OREB: ArrayLike,
         OPP_DREB: ArrayLike,
         OPP_TOV: ArrayLike,
-        **_  # TODO: Override function to take possessions as input
+        POSS: ArrayLike = None,
+        OPP_POSS: ArrayLike = None,
+        **_
     ) -> ArrayLike:
         """
         Pace Factor (PACE)
@@ -776,43 +1719,41 @@ class TeamStats(Stats):
             OPP_OREB (ArrayLike): opponent offensive rebounds\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
             OPP_TOV (ArrayLike): opponent turnovers\n
+            POSS (ArrayLike, optional): precomputed possessions.\n
+            OPP_POSS (ArrayLike, optional): precomputed opponent possessions. Equal to
+                POSS when omitted.\n
 
         Returns:
             ArrayLike: team pace
         """
-        poss = self.possessions(
-            FGA=FGA,
-            FGM=FGM,
-            FTA=FTA,
-            DREB=DREB,
-            OREB=OREB,
-            TOV=TOV,
-            OPP_FGA=OPP_FGA,
-            OPP_FGM=OPP_FGM,
-            OPP_FTA=OPP_FTA,
-            OPP_OREB=OPP_OREB,
-            OPP_DREB=OPP_DREB,
-            OPP_TOV=OPP_TOV,
-        )
-        opp_poss = self.possessions(
-            FGA=OPP_FGA,
-            FGM=OPP_FGM,
-            FTA=OPP_FTA,
-            DREB=OPP_DREB,
-            OREB=OPP_OREB,
-            TOV=OPP_TOV,
-            OPP_FGA=FGA,
-            OPP_FGM=FGM,
-            OPP_FTA=FTA,
-            OPP_OREB=OREB,
-            OPP_DREB=DREB,
-            OPP_TOV=TOV,
-        )
-        return np.multiply(
-            48, np.divide(np.add(poss, opp_poss), np.multiply(2, np.divide(MP, 5)))
-        )
-
-    def offensive_rating(  # TODO: Overload function to take possessions as input
+        if POSS is None:
+            POSS = self.possessions(
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                DREB=DREB,
+                OREB=OREB,
+                TOV=TOV,
+                OPP_FGA=OPP_FGA,
+                OPP_FGM=OPP_FGM,
+                OPP_FTA=OPP_FTA,
+                OPP_OREB=OPP_OREB,
+                OPP_DREB=OPP_DREB,
+                OPP_TOV=OPP_TOV,
+            )
+        # 48 / (2 * (MP / 5)) folded into a single constant: 120 / MP
+        # Divided out of place, so the result takes the shape of every operand
+        if OPP_POSS is None:  # POSS averages both teams' estimates, so OPP_POSS == POSS
+            pace = POSS / MP
+            pace *= 240
+        else:
+            pace = POSS + OPP_POSS
+            pace = pace / MP
+            pace *= 120
+        return pace
+
+    @_scalar_or_array
+    def offensive_rating(
         self,
         PTS: ArrayLike,
         FGA: ArrayLike,
@@ -827,6 +1768,7 @@ class TeamStats(Stats):
         OPP_OREB: ArrayLike,
         OPP_DREB: ArrayLike,
         OPP_TOV: ArrayLike,
+        POSS: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -850,26 +1792,31 @@ class TeamStats(Stats):
             OPP_OREB (ArrayLike): opponent offensive rebounds\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
             OPP_TOV (ArrayLike): opponent turnovers\n
+            POSS (ArrayLike, optional): precomputed possessions.\n
 
         Returns:
             ArrayLike: team offensive rating
         """
-        poss = self.possessions(
-            FGA=FGA,
-            FGM=FGM,
-            FTA=FTA,
-            DREB=DREB,
-            OREB=OREB,
-            TOV=TOV,
-            OPP_FGA=OPP_FGA,
-            OPP_FGM=OPP_FGM,
-            OPP_FTA=OPP_FTA,
-            OPP_OREB=OPP_OREB,
-            OPP_DREB=OPP_DREB,
-            OPP_TOV=OPP_TOV,
-        )
-        return np.multiply(100, np.divide(PTS, poss))
+        if POSS is None:
+            POSS = self.possessions(
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                DREB=DREB,
+                OREB=OREB,
+                TOV=TOV,
+                OPP_FGA=OPP_FGA,
+                OPP_FGM=OPP_FGM,
+                OPP_FTA=OPP_FTA,
+                OPP_OREB=OPP_OREB,
+                OPP_DREB=OPP_DREB,
+                OPP_TOV=OPP_TOV,
+            )
+        rating = PTS / POSS  # Out of place: POSS may be the larger operand
+        rating *= 100.0
+        return rating
 
+    @_scalar_or_array
     def defensive_rating(
         self,
         FGA: ArrayLike,
@@ -885,6 +1832,7 @@ class TeamStats(Stats):
         OPP_OREB: ArrayLike,
         OPP_DREB: ArrayLike,
         OPP_TOV: ArrayLike,
+        POSS: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -908,30 +1856,35 @@ class TeamStats(Stats):
             OPP_OREB (ArrayLike): opponent offensive rebounds\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
             OPP_TOV (ArrayLike): opponent turnovers\n
+            POSS (ArrayLike, optional): precomputed possessions.\n
 
         Returns:
             ArrayLike: team defensive rating
         """
-        poss = self.possessions(
-            FGA=FGA,
-            FGM=FGM,
-            FTA=FTA,
-            DREB=DREB,
-            OREB=OREB,
-            TOV=TOV,
-            OPP_FGA=OPP_FGA,
-            OPP_FGM=OPP_FGM,
-            OPP_FTA=OPP_FTA,
-            OPP_OREB=OPP_OREB,
-            OPP_DREB=OPP_DREB,
-            OPP_TOV=OPP_TOV,
-        )
-        return np.multiply(100, np.divide(OPP_PTS, poss))
+        if POSS is None:
+            POSS = self.possessions(
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                DREB=DREB,
+                OREB=OREB,
+                TOV=TOV,
+                OPP_FGA=OPP_FGA,
+                OPP_FGM=OPP_FGM,
+                OPP_FTA=OPP_FTA,
+                OPP_OREB=OPP_OREB,
+                OPP_DREB=OPP_DREB,
+                OPP_TOV=OPP_TOV,
+            )
+        rating = OPP_PTS / POSS  # Out of place: POSS may be the larger operand
+        rating *= 100.0
+        return rating
 
     def strength_of_schedule(self, **_) -> ArrayLike:
         # Source: https://web.archive.org/web/20180531115621/https://www.pro-football-reference.com/blog/index4837.html?p=37
-        return []
+        return _EMPTY
 
+    @_scalar_or_array
     def games_behind(
         self,
         TEAM_WINS: ArrayLike,
@@ -956,32 +1909,15 @@ class TeamStats(Stats):
         Returns:
             ArrayLike: games behind.
         """
-        return np.divide(
-            np.add(
-                np.subtract(FIRST_PLACE_WINS, TEAM_WINS),
-                np.subtract(TEAM_LOSSES, FIRST_PLACE_LOSSES),
-            ),
-            2,
-        )
+        return (
+            (FIRST_PLACE_WINS - TEAM_WINS) + (TEAM_LOSSES - FIRST_PLACE_LOSSES)
+        ) * 0.5
 
-    def _get_required_stat_params(self) -> List[str]:
-        """
-        Aggregate list of required parameters for all statistics
-        this class can compute.
 
-        Returns:
-            List[str]: list of all possible required parameters.
-        """
-        all_stat_methods = {
-            **self.independent_stat_method_map,
-            **self.dependent_stat_method_map,
-        }
-        all_params = []
-        for stat_func in all_stat_methods.values():
-            all_params.extend(inspect.getfullargspec(stat_func).args)
-        all_params = sorted(np.unique(all_params))
-        all_params.remove("self")
-        return all_params
+@functools.lru_cache(maxsize=None)
+def _shared_team_stats(**settings) -> TeamStats:
+    """Build one TeamStats per distinct set of constructor settings."""
+    return TeamStats(**settings)
 
 
 class PlayerStats(Stats):
@@ -1002,6 +1938,8 @@ class PlayerStats(Stats):
         four_factor_turnover_weight: float = 0.25,
         four_factor_rebounding_weight: float = 0.2,
         four_factor_free_throw_weight: float = 0.15,
+        xp=np,
+        dtype=np.float32,
     ) -> None:
         super().__init__(
             free_throw_weight=free_throw_weight,
@@ -1010,16 +1948,16 @@ class PlayerStats(Stats):
             four_factor_rebounding_weight=four_factor_rebounding_weight,
             four_factor_shooting_weight=four_factor_shooting_weight,
             four_factor_turnover_weight=four_factor_turnover_weight,
-        )
-        self.team_stats = TeamStats(
-            free_throw_weight=free_throw_weight,
-            pythagorean_exponent=pythagorean_exponent,
-            four_factor_free_throw_weight=four_factor_free_throw_weight,
-            four_factor_rebounding_weight=four_factor_rebounding_weight,
-            four_factor_shooting_weight=four_factor_shooting_weight,
-            four_factor_turnover_weight=four_factor_turnover_weight,
+            xp=xp,
+            dtype=dtype,
         )
         self.independent_stat_method_map.update({"GAME_SCORE": self.game_score})
+        self.stat_expressions.update(
+            {
+                "GAME_SCORE": "PTS + 0.4 * (FGM - (FTA - FTM) - PF)"
+                " + 0.7 * (OREB + AST + BLK - FGA) + 0.3 * DREB + STL - TOV",
+            }
+        )
         self.dependent_stat_method_map = (
             {  # Map functions which require opponent/team data
                 "AST%": self.assist_pct,
@@ -1035,8 +1973,35 @@ class PlayerStats(Stats):
                 "FLOOR%": self.floor_pct,
             }
         )
+        self.intermediate_stat_method_map = {  # Team terms shared across stats
+            "MP_SHARE": self._minutes_share,
+            "TEAM_OREB_PCT": self._team_oreb_pct,
+            "TEAM_MINOR_POSS": self._team_minor_possessions,
+            "TEAM_SCORING_POSS": self._team_scoring_possessions,
+            "TEAM_SCORE_RATE": self._team_score_rate,
+            "TEAM_OREB_WEIGHT": self._team_oreb_weight,
+            "QAST": self._qAST,
+            "OREB_PART": self._oreb_part,
+            "SCORING_POSS": self._scoring_possessions,
+        }
         self.required_stat_params = self._get_required_stat_params()
-
+        self.stat_graph = self._build_stat_graph()
+
+    @functools.cached_property
+    def team_stats(self) -> TeamStats:
+        """TeamStats with this instance's settings, shared by equal PlayerStats."""
+        return _shared_team_stats(
+            free_throw_weight=self._ft_weight,
+            pythagorean_exponent=self._pythagorean_exp,
+            four_factor_shooting_weight=self._four_factor_shooting_weight,
+            four_factor_turnover_weight=self._four_factor_turnover_weight,
+            four_factor_rebounding_weight=self._four_factor_rebounding_weight,
+            four_factor_free_throw_weight=self._four_factor_free_throw_weight,
+            xp=self.xp,
+            dtype=self.dtype,
+        )
+
+    @_scalar_or_array
     def assist_pct(
         self,
         AST: ArrayLike,
@@ -1044,6 +2009,7 @@ class PlayerStats(Stats):
         MP: ArrayLike,
         TEAM_FGM: ArrayLike,
         TEAM_MP: ArrayLike,
+        MP_SHARE: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1059,24 +2025,16 @@ class PlayerStats(Stats):
             MP (ArrayLike): player minutes played\n
             TEAM_FGM (ArrayLike): team field goal makes\n
             TEAM_MP (ArrayLike: team minutes played\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
 
         Returns:
             ArrayLike: player assist rate/percentage
         """
-        return np.multiply(
-            100,
-            np.divide(
-                AST,
-                np.subtract(
-                    np.multiply(
-                        np.divide(MP, np.divide(TEAM_MP, 5)),
-                        TEAM_FGM,
-                    ),
-                    FGM,
-                ),
-            ),
-        )
+        if MP_SHARE is None:
+            MP_SHARE = self._minutes_share(MP=MP, TEAM_MP=TEAM_MP)
+        return 100 * _safe_divide(AST, MP_SHARE * TEAM_FGM - FGM)
 
+    @_scalar_or_array
     def defensive_rebound_pct(
         self,
         DREB: ArrayLike,
@@ -1103,14 +2061,9 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: defensive rebounding rate/percentage
         """
-        return np.multiply(
-            100,
-            np.divide(
-                np.multiply(DREB, np.divide(TEAM_MP, 5)),
-                np.multiply(MP, np.add(TEAM_DREB, OPP_OREB)),
-            ),
-        )
+        return 100 * _safe_divide(DREB * (TEAM_MP * 0.2), MP * (TEAM_DREB + OPP_OREB))
 
+    @_scalar_or_array
     def offensive_rebound_pct(
         self,
         OREB: ArrayLike,
@@ -1137,14 +2090,9 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: offensive rebound percentage
         """
-        return np.multiply(
-            100,
-            np.divide(
-                np.multiply(OREB, np.divide(TEAM_MP, 5)),
-                np.multiply(MP, np.add(TEAM_OREB, OPP_DREB)),
-            ),
-        )
+        return 100 * _safe_divide(OREB * (TEAM_MP * 0.2), MP * (TEAM_OREB + OPP_DREB))
 
+    @_scalar_or_array
     def rebound_pct(
         self,
         DREB: ArrayLike,
@@ -1155,6 +2103,8 @@ class PlayerStats(Stats):
         TEAM_MP: ArrayLike,
         OPP_DREB: ArrayLike,
         OPP_OREB: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        **_
     ) -> ArrayLike:
         """
         Rebound Percentage (REB%)
@@ -1169,27 +2119,19 @@ class PlayerStats(Stats):
             TEAM_MP (ArrayLike): team minutes played\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
             OPP_OREB (ArrayLike): opponent offensive rebounds\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
 
         Returns:
             ArrayLike: rebound rate/percentage
         """
-        return np.add(
-            self.defensive_rebound_pct(
-                DREB=DREB,
-                MP=MP,
-                TEAM_DREB=TEAM_DREB,
-                TEAM_MP=TEAM_MP,
-                OPP_OREB=OPP_OREB,
-            ),
-            self.offensive_rebound_pct(
-                OREB=OREB,
-                MP=MP,
-                TEAM_OREB=TEAM_OREB,
-                TEAM_MP=TEAM_MP,
-                OPP_DREB=OPP_DREB,
-            ),
+        if MP_SHARE is None:
+            MP_SHARE = self._minutes_share(MP=MP, TEAM_MP=TEAM_MP)
+        # DREB% and OREB% share (TEAM_MP / 5) / MP == 1 / MP_SHARE
+        return 100 * _safe_divide(
+            DREB / (TEAM_DREB + OPP_OREB) + OREB / (TEAM_OREB + OPP_DREB), MP_SHARE
         )
 
+    @_scalar_or_array
     def block_pct(
         self,
         BLK: ArrayLike,
@@ -1216,17 +2158,11 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: player block rate / percentage
         """
-        return np.multiply(
-            100,
-            np.divide(
-                np.multiply(
-                    BLK,
-                    np.divide(TEAM_MP, 5),
-                ),
-                np.multiply(PLAYER_MP, np.subtract(OPP_FGA, OPP_FG3A)),
-            ),
+        return 100 * _safe_divide(
+            BLK * (TEAM_MP * 0.2), PLAYER_MP * (OPP_FGA - OPP_FG3A)
         )
 
+    @_scalar_or_array
     def steal_pct(
         self,
         STL: ArrayLike,
@@ -1251,14 +2187,9 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: steal percentage
         """
-        return np.multiply(
-            100,
-            np.divide(
-                np.multiply(STL, np.divide(TEAM_MP, 5)),
-                np.multiply(MP, OPP_POSS),
-            ),
-        )
+        return 100 * _safe_divide(STL * (TEAM_MP * 0.2), MP * OPP_POSS)
 
+    @_scalar_or_array
     def usage_rate(
         self,
         FGA: ArrayLike,
@@ -1269,6 +2200,8 @@ class PlayerStats(Stats):
         TEAM_FTA: ArrayLike,
         TEAM_TOV: ArrayLike,
         TEAM_MP: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        TEAM_MINOR_POSS: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1287,29 +2220,106 @@ class PlayerStats(Stats):
             TEAM_FTA (ArrayLike): team free throw attempts\n
             TEAM_TOV (ArrayLike): team turnovers\n
             TEAM_MP (ArrayLike): team minutes played\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            TEAM_MINOR_POSS (ArrayLike, optional): precomputed team minor possessions.\n
 
         Returns:
             ArrayLike: player usage rate.
         """
+        if MP_SHARE is None:
+            MP_SHARE = self._minutes_share(MP=MP, TEAM_MP=TEAM_MP)
+        if TEAM_MINOR_POSS is None:
+            TEAM_MINOR_POSS = self._team_minor_possessions(
+                TEAM_FGA=TEAM_FGA, TEAM_FTA=TEAM_FTA, TEAM_TOV=TEAM_TOV
+            )
         player_minor_possessions = self.minor_possessions(FGA=FGA, FTA=FTA, TOV=TOV)
-        team_minor_possessions = self.minor_possessions(
-            FGA=TEAM_FGA, FTA=TEAM_FTA, TOV=TEAM_TOV
+        # (TEAM_MP / 5) / MP == 1 / MP_SHARE
+        return 100 * _safe_divide(
+            player_minor_possessions, MP_SHARE * TEAM_MINOR_POSS
         )
 
-        return np.multiply(
-            100,
-            np.divide(
-                np.multiply(
-                    player_minor_possessions,
-                    np.divide(TEAM_MP, 5),
-                ),
-                np.multiply(
-                    MP,
-                    team_minor_possessions,
-                ),
-            ),
-        )
+    def team_context(
+        self, team_idx: ArrayLike = None, **team_data: ArrayLike
+    ) -> Dict[str, ArrayLike]:
+        """
+        Team terms shared by player stats, computed once per team.
+
+        Team data is constant across a team's players, so it can be passed with one
+        row per team(-game) plus team_idx, the team row of each player row. The team
+        terms are then evaluated on the team rows only and gathered to player rows.
+        The result can be unpacked into offensive_rating, floor_pct, etc.
+
+        Args:
+            team_idx (ArrayLike, optional): team row of each player row. Defaults to
+                None (team data already has one row per player row).\n
+            team_data (ArrayLike): TEAM_/OPP_ columns named after the NBA API.\n
+
+        Returns:
+            Dict[str, ArrayLike]: team data plus TEAM_OREB_PCT, TEAM_SCORING_POSS,
+                TEAM_SCORE_RATE and TEAM_OREB_WEIGHT, one row per player row.
+        """
+        context = dict(team_data)
+        context["TEAM_OREB_PCT"] = self._team_oreb_pct(**context)
+        context["TEAM_SCORING_POSS"] = self._team_scoring_possessions(**context)
+        context["TEAM_SCORE_RATE"] = self._team_score_rate(**context)
+        context["TEAM_OREB_WEIGHT"] = self._team_oreb_weight(**context)
+        if team_idx is None:
+            return context
+        team_idx = self.xp.asarray(team_idx)
+        return {
+            name: self.xp.asarray(values)[team_idx] for name, values in context.items()
+        }
+
+    @_scalar_or_array
+    def _minutes_share(self, MP: ArrayLike, TEAM_MP: ArrayLike, **_) -> ArrayLike:
+        """
+        Share of team minutes played by a player (MP_SHARE).
+            MP_SHARE = MP / (TEAM_MP / 5)
+
+        Args:
+            MP (ArrayLike): player minutes played\n
+            TEAM_MP (ArrayLike): team minutes played\n
+
+        Returns:
+            ArrayLike: fraction of available minutes a player was on the floor.
+        """
+        return MP / (TEAM_MP * 0.2)
+
+    @_scalar_or_array
+    def _team_oreb_pct(
+        self, TEAM_OREB: ArrayLike, OPP_DREB: ArrayLike, **_
+    ) -> ArrayLike:
+        """
+        Team Offensive Rebound Percentage (TEAM_OREB%) from player-row team data.
+            TEAM_OREB% = TEAM_OREB / (TEAM_OREB + OPP_DREB)
 
+        Args:
+            TEAM_OREB (ArrayLike): team offensive rebounds\n
+            OPP_DREB (ArrayLike): opponent defensive rebounds\n
+
+        Returns:
+            ArrayLike: team offensive rebound percentage.
+        """
+        return self.team_stats.offensive_rebound_pct(OREB=TEAM_OREB, OPP_DREB=OPP_DREB)
+
+    @_scalar_or_array
+    def _team_minor_possessions(
+        self, TEAM_FGA: ArrayLike, TEAM_FTA: ArrayLike, TEAM_TOV: ArrayLike, **_
+    ) -> ArrayLike:
+        """
+        Team Minor Possession estimate (TEAM_MINOR_POSS) from player-row team data.
+
+        Args:
+            TEAM_FGA (ArrayLike): team field goal attempts\n
+            TEAM_FTA (ArrayLike): team free throw attempts\n
+            TEAM_TOV (ArrayLike): team turnovers\n
+
+        Returns:
+            ArrayLike: team minor possession estimate
+        """
+        return self.minor_possessions(FGA=TEAM_FGA, FTA=TEAM_FTA, TOV=TEAM_TOV)
+
+    @_scalar_or_array
     def _qAST(
         self,
         FGM: ArrayLike,
@@ -1318,6 +2328,7 @@ class PlayerStats(Stats):
         TEAM_FGM: ArrayLike,
         TEAM_AST: ArrayLike,
         TEAM_MP: ArrayLike,
+        MP_SHARE: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1342,30 +2353,48 @@ class PlayerStats(Stats):
             TEAM_FGM (ArrayLike): team field goal makes\n
             TEAM_AST (ArrayLike): team assists\n
             TEAM_MP (ArrayLike): team minutes played\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
 
         Returns:
             ArrayLike: _qAST term in Field Goal Part of Scoring Possessions component of Individual Total Possessions.
         """
-        return np.add(
-            np.multiply(
-                np.divide(MP, np.divide(TEAM_MP, 5)),
-                np.multiply(1.14, np.divide(np.subtract(TEAM_AST, AST), TEAM_FGM)),
-            ),
-            np.multiply(
-                np.divide(
-                    np.subtract(
-                        np.multiply(np.divide(TEAM_AST, TEAM_MP), np.multiply(MP, 5)),
-                        AST,
-                    ),
-                    np.subtract(
-                        np.multiply(np.divide(TEAM_FGM, TEAM_MP), np.multiply(MP, 5)),
-                        FGM,
-                    ),
-                ),
-                np.subtract(1, np.divide(MP, np.divide(TEAM_MP, 5))),
-            ),
-        )
-
+        # Note (TEAM_X / TEAM_MP) * MP * 5 == TEAM_X * (MP / (TEAM_MP / 5)).
+        shape, dtype = _broadcast_spec(
+            FGM, AST, MP, TEAM_FGM, TEAM_AST, TEAM_MP, MP_SHARE
+        )
+        if not shape:  # Scalar and 0-d results cannot be written in place
+            mp_share = MP / TEAM_MP * 5 if MP_SHARE is None else MP_SHARE
+            return mp_share * (1.14 * ((TEAM_AST - AST) / TEAM_FGM)) + _safe_divide(
+                TEAM_AST * mp_share - AST, TEAM_FGM * mp_share - FGM
+            ) * (1 - mp_share)
+        # Evaluated in place: one output array plus pooled scratch buffers.
+        qAST = np.subtract(TEAM_AST, AST, out=self.xp.empty(shape, dtype))
+        qAST /= TEAM_FGM
+        mp_share = self._buffer_pool.get(shape, dtype)
+        ast_rate = self._buffer_pool.get(shape, dtype)
+        fgm_rate = self._buffer_pool.get(shape, dtype)
+        if MP_SHARE is None:
+            np.divide(MP, TEAM_MP, out=mp_share)
+            mp_share *= 5
+        else:
+            mp_share[...] = MP_SHARE
+        qAST *= 1.14
+        qAST *= mp_share
+        np.multiply(TEAM_AST, mp_share, out=ast_rate)
+        np.subtract(ast_rate, AST, out=ast_rate)
+        np.multiply(TEAM_FGM, mp_share, out=fgm_rate)
+        np.subtract(fgm_rate, FGM, out=fgm_rate)
+        # Players who did not play have no FGM share: 0 instead of 0 / 0
+        no_share = fgm_rate == 0
+        np.divide(ast_rate, fgm_rate, out=ast_rate, where=~no_share)
+        ast_rate[no_share] = 0
+        np.subtract(1, mp_share, out=mp_share)
+        np.multiply(ast_rate, mp_share, out=ast_rate)
+        qAST += ast_rate
+        self._buffer_pool.release(mp_share, ast_rate, fgm_rate)
+        return qAST
+
+    @_scalar_or_array
     def _scposs_fg_part(
         self,
         PTS: ArrayLike,
@@ -1377,6 +2406,8 @@ class PlayerStats(Stats):
         TEAM_MP: ArrayLike,
         TEAM_FGM: ArrayLike,
         TEAM_AST: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        QAST: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1398,32 +2429,26 @@ class PlayerStats(Stats):
             TEAM_FGM (ArrayLike): team field goal makes\n
             TEAM_AST (ArrayLike): team assists\n
             TEAM_MP (ArrayLike): team minutes played\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            QAST (ArrayLike, optional): precomputed _qAST.\n
 
         Returns:
             ArrayLike: Field Goal Part of Scoring Possessions Component of Individual Total Possessions.
         """
-        qAST = self._qAST(
-            MP=MP,
-            FGM=FGM,
-            AST=AST,
-            TEAM_MP=TEAM_MP,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_AST=TEAM_AST,
-        )
-        return np.multiply(
-            FGM,
-            np.subtract(
-                1,
-                np.multiply(
-                    0.5,
-                    np.multiply(
-                        np.divide(np.subtract(PTS, FTM), np.multiply(2, FGA)),
-                        qAST,
-                    ),
-                ),
-            ),
-        )
-
+        if QAST is None:
+            QAST = self._qAST(
+                MP=MP,
+                FGM=FGM,
+                AST=AST,
+                TEAM_MP=TEAM_MP,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_AST=TEAM_AST,
+                MP_SHARE=MP_SHARE,
+            )
+        # 0.5 * (PTS - FTM) / (2 * FGA) folded into a single constant
+        return FGM * (1 - 0.25 * QAST * _safe_divide(PTS - FTM, FGA))
+
+    @_scalar_or_array
     def _scposs_assist_part(
         self,
         PTS: ArrayLike,
@@ -1456,17 +2481,10 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: Assist Part of Scoring Possessions component of Individual Total Possessions.
         """
-        return np.multiply(
-            0.5,
-            np.multiply(
-                np.divide(
-                    np.subtract(np.subtract(TEAM_PTS, TEAM_FTM), np.subtract(PTS, FTM)),
-                    np.multiply(2, np.subtract(TEAM_FGA, FGA)),
-                ),
-                AST,
-            ),
-        )
+        # 0.5 * x / (2 * y) folded into a single constant
+        return 0.25 * ((TEAM_PTS - TEAM_FTM) - (PTS - FTM)) / (TEAM_FGA - FGA) * AST
 
+    @_scalar_or_array
     def _scposs_ft_part(self, FTM: ArrayLike, FTA: ArrayLike, **_) -> ArrayLike:
         """
         Free Throw Part of Scoring Possessions Component of Individual Total Possessions.
@@ -1484,20 +2502,10 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: Free Throw Part of Scoring Possessions component of Individual Total Possessions.
         """
-        return np.multiply(
-            np.subtract(
-                1,
-                np.power(
-                    np.subtract(1, np.divide(FTM, FTA)),
-                    2,
-                ),
-            ),
-            np.multiply(
-                0.4,
-                FTA,
-            ),
-        )
+        ft_miss = 1 - _safe_divide(FTM, FTA)
+        return (1 - ft_miss * ft_miss) * 0.4 * FTA
 
+    @_scalar_or_array
     def _team_scoring_possessions(
         self, TEAM_FGM: ArrayLike, TEAM_FTA: ArrayLike, TEAM_FTM: ArrayLike, **_
     ) -> ArrayLike:
@@ -1520,23 +2528,10 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: Team Scoring Possessions Term in Individual Total Possessions.
         """
-        return np.add(
-            TEAM_FGM,
-            np.multiply(
-                np.subtract(
-                    1,
-                    np.power(
-                        np.subtract(1, np.divide(TEAM_FTM, TEAM_FTA)),
-                        2,
-                    ),
-                ),
-                np.multiply(
-                    self._ft_weight,
-                    TEAM_FTA,
-                ),
-            ),
-        )
+        ft_miss = 1 - TEAM_FTM / TEAM_FTA
+        return TEAM_FGM + (1 - ft_miss * ft_miss) * self._ft_weight * TEAM_FTA
 
+    @_scalar_or_array
     def _team_score_rate(  # TODO: transfer all team stats over to TeamStats object
         self,
         TEAM_FGA: ArrayLike,
@@ -1544,6 +2539,8 @@ class PlayerStats(Stats):
         TEAM_FTA: ArrayLike,
         TEAM_FTM: ArrayLike,
         TEAM_TOV: ArrayLike,
+        TEAM_SCORING_POSS: ArrayLike = None,
+        TEAM_MINOR_POSS: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1562,18 +2559,23 @@ class PlayerStats(Stats):
             TEAM_FTA (ArrayLike): team free throw attempts\n
             TEAM_FTM (ArrayLike): team free throw makes\n
             TEAM_TOV (ArrayLike): team turnovers\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
+            TEAM_MINOR_POSS (ArrayLike, optional): precomputed team minor possessions.\n
 
         Returns:
             ArrayLike: Team Play Percentage term in OREB Part of Individual Total Possessions.
         """
-        team_scoring_possessions = self._team_scoring_possessions(
-            TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
-        )
-        team_minor_possessions = self.minor_possessions(
-            FGA=TEAM_FGA, FTA=TEAM_FTA, TOV=TEAM_TOV
-        )
-        return np.divide(team_scoring_possessions, team_minor_possessions)
-
+        if TEAM_SCORING_POSS is None:
+            TEAM_SCORING_POSS = self._team_scoring_possessions(
+                TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
+            )
+        if TEAM_MINOR_POSS is None:
+            TEAM_MINOR_POSS = self._team_minor_possessions(
+                TEAM_FGA=TEAM_FGA, TEAM_FTA=TEAM_FTA, TEAM_TOV=TEAM_TOV
+            )
+        return _safe_divide(TEAM_SCORING_POSS, TEAM_MINOR_POSS)
+
+    @_scalar_or_array
     def _team_oreb_weight(
         self,
         TEAM_FGA: ArrayLike,
@@ -1583,6 +2585,8 @@ class PlayerStats(Stats):
         TEAM_OREB: ArrayLike,
         TEAM_TOV: ArrayLike,
         OPP_DREB: ArrayLike,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_OREB_PCT: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1602,31 +2606,50 @@ class PlayerStats(Stats):
             TEAM_OREB (ArrayLike): team offensive rebounds\n
             TEAM_TOV (ArrayLike): team turnovers\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_OREB_PCT (ArrayLike, optional): precomputed team OREB%.\n
 
         Returns:
             ArrayLike: Team Offensive Rebound Weight in Individual Total Possessions.
         """
-        team_off_reb_pct = self.team_stats.offensive_rebound_pct(
-            OREB=TEAM_OREB, OPP_DREB=OPP_DREB
-        )
-        team_score_rate = self._team_score_rate(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_TOV=TEAM_TOV,
-        )
-        return np.divide(
-            np.multiply(
-                np.subtract(1, team_off_reb_pct),
-                team_score_rate,
-            ),
-            np.add(
-                np.multiply(np.subtract(1, team_off_reb_pct), team_score_rate),
-                np.multiply(team_off_reb_pct, np.subtract(1, team_score_rate)),
-            ),
-        )
-
+        team_off_reb_pct = (
+            self._team_oreb_pct(TEAM_OREB=TEAM_OREB, OPP_DREB=OPP_DREB)
+            if TEAM_OREB_PCT is None
+            else TEAM_OREB_PCT
+        )
+        team_score_rate = (
+            self._team_score_rate(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_TOV=TEAM_TOV,
+            )
+            if TEAM_SCORE_RATE is None
+            else TEAM_SCORE_RATE
+        )
+        # a / (a + b) with a = (1 - TEAM_OREB%) * TEAM_SCORE_RATE computed once and
+        # b = TEAM_OREB% * (1 - TEAM_SCORE_RATE); TeamStats OREB% is a 0-1 fraction.
+        shape, dtype = _broadcast_spec(team_off_reb_pct, team_score_rate)
+        if not shape:  # Scalar and 0-d results cannot be written in place
+            team_oreb_weight = (1 - team_off_reb_pct) * team_score_rate
+            return team_oreb_weight / (
+                team_oreb_weight + team_off_reb_pct * (1 - team_score_rate)
+            )
+        # Evaluated in place: one output array plus a pooled scratch buffer
+        team_oreb_weight = np.subtract(
+            1, team_off_reb_pct, out=self.xp.empty(shape, dtype)
+        )
+        team_oreb_weight *= team_score_rate
+        denominator = self._buffer_pool.get(shape, dtype)
+        np.subtract(1, team_score_rate, out=denominator)
+        np.multiply(denominator, team_off_reb_pct, out=denominator)
+        np.add(denominator, team_oreb_weight, out=denominator)
+        team_oreb_weight /= denominator
+        self._buffer_pool.release(denominator)
+        return team_oreb_weight
+
+    @_scalar_or_array
     def _oreb_part(
         self,
         OREB: ArrayLike,
@@ -1637,6 +2660,8 @@ class PlayerStats(Stats):
         TEAM_OREB: ArrayLike,
         TEAM_TOV: ArrayLike,
         OPP_DREB: ArrayLike,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1657,34 +2682,34 @@ class PlayerStats(Stats):
             TEAM_OREB (ArrayLike): team offensive rebounds\n
             TEAM_TOV (ArrayLike): team turnovers\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
 
         Returns:
             ArrayLike: Offensive Rebound Part of Individual Total Possessions.
         """
-        team_oreb_weight = self._team_oreb_weight(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_TOV=TEAM_TOV,
-            OPP_DREB=OPP_DREB,
-        )
-        team_score_rate = self._team_score_rate(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_TOV=TEAM_TOV,
-        )
-        return np.multiply(
-            OREB,
-            np.multiply(
-                team_oreb_weight,
-                team_score_rate,
-            ),
-        )
+        if TEAM_SCORE_RATE is None:
+            TEAM_SCORE_RATE = self._team_score_rate(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_TOV=TEAM_TOV,
+            )
+        if TEAM_OREB_WEIGHT is None:
+            TEAM_OREB_WEIGHT = self._team_oreb_weight(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_TOV=TEAM_TOV,
+                OPP_DREB=OPP_DREB,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+            )
+        return OREB * (TEAM_OREB_WEIGHT * TEAM_SCORE_RATE)
 
+    @_scalar_or_array
     def _scoring_possessions(
         self,
         PTS: ArrayLike,
@@ -1705,6 +2730,13 @@ class PlayerStats(Stats):
         TEAM_TOV: ArrayLike,
         TEAM_MP: ArrayLike,
         OPP_DREB: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        TEAM_SCORING_POSS: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        TEAM_OREB_PCT: ArrayLike = None,
+        QAST: ArrayLike = None,
+        OREB_PART: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1735,10 +2767,43 @@ class PlayerStats(Stats):
             TEAM_TOV (ArrayLike): team turnovers\n
             TEAM_MP (ArrayLike): team minutes played\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            TEAM_OREB_PCT (ArrayLike, optional): precomputed team OREB%.\n
+            QAST (ArrayLike, optional): precomputed _qAST.\n
+            OREB_PART (ArrayLike, optional): precomputed _oreb_part.\n
 
         Returns:
             ArrayLike: Scoring Possessions component of Individual Total Possessions.
         """
+        # Shared team terms are computed once and threaded through the helpers
+        if TEAM_SCORING_POSS is None:
+            TEAM_SCORING_POSS = self._team_scoring_possessions(
+                TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
+            )
+        if TEAM_SCORE_RATE is None:
+            TEAM_SCORE_RATE = self._team_score_rate(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+            )
+        if TEAM_OREB_WEIGHT is None:
+            TEAM_OREB_WEIGHT = self._team_oreb_weight(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_TOV=TEAM_TOV,
+                OPP_DREB=OPP_DREB,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                TEAM_OREB_PCT=TEAM_OREB_PCT,
+            )
         scposs_fg_part = self._scposs_fg_part(
             PTS=PTS,
             FGA=FGA,
@@ -1749,6 +2814,8 @@ class PlayerStats(Stats):
             TEAM_MP=TEAM_MP,
             TEAM_FGM=TEAM_FGM,
             TEAM_AST=TEAM_AST,
+            MP_SHARE=MP_SHARE,
+            QAST=QAST,
         )
         scposs_ast_part = self._scposs_assist_part(
             PTS=PTS,
@@ -1760,70 +2827,58 @@ class PlayerStats(Stats):
             TEAM_FTM=TEAM_FTM,
         )
         scposs_ft_part = self._scposs_ft_part(FTM=FTM, FTA=FTA)
-        team_scoring_possessions = self._team_scoring_possessions(
-            TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
-        )
-        team_oreb_weight = self._team_oreb_weight(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_TOV=TEAM_TOV,
-            OPP_DREB=OPP_DREB,
-        )
-        team_score_rate = self._team_score_rate(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_TOV=TEAM_TOV,
-        )
-        oreb_part = self._oreb_part(
-            OREB=OREB,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_TOV=TEAM_TOV,
-            OPP_DREB=OPP_DREB,
-        )
-        return np.add(
-            np.multiply(
-                np.sum(
-                    np.array(
-                        [
-                            scposs_fg_part,
-                            scposs_ast_part,
-                            scposs_ft_part,
-                        ]
-                    ),
-                    axis=0,
-                ),
-                np.multiply(
-                    np.subtract(
-                        1,
-                        np.divide(
-                            TEAM_OREB,
-                            team_scoring_possessions,
-                        ),
-                    ),
-                    np.multiply(
-                        team_oreb_weight,
-                        team_score_rate,
-                    ),
-                ),
-            ),
-            oreb_part,
-        )
-
+        if OREB_PART is None:
+            OREB_PART = self._oreb_part(
+                OREB=OREB,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_TOV=TEAM_TOV,
+                OPP_DREB=OPP_DREB,
+                TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+            )
+        shape, dtype = _broadcast_spec(
+            scposs_fg_part,
+            scposs_ast_part,
+            scposs_ft_part,
+            OREB_PART,
+            TEAM_OREB,
+            TEAM_SCORING_POSS,
+            TEAM_OREB_WEIGHT,
+            TEAM_SCORE_RATE,
+        )
+        if not shape:  # Scalar and 0-d results cannot be written in place
+            return (scposs_fg_part + scposs_ast_part + scposs_ft_part) * (
+                (1 - TEAM_OREB / TEAM_SCORING_POSS)
+                * (TEAM_OREB_WEIGHT * TEAM_SCORE_RATE)
+            ) + OREB_PART
+        # Combined in place: one output array plus pooled scratch buffers.
+        scoring_poss = np.add(
+            scposs_fg_part, scposs_ast_part, out=self.xp.empty(shape, dtype)
+        )
+        scoring_poss += scposs_ft_part
+        team_share = self._buffer_pool.get(shape, dtype)
+        oreb_rate = self._buffer_pool.get(shape, dtype)
+        np.divide(TEAM_OREB, TEAM_SCORING_POSS, out=team_share)
+        np.subtract(1, team_share, out=team_share)
+        np.multiply(TEAM_OREB_WEIGHT, TEAM_SCORE_RATE, out=oreb_rate)
+        np.multiply(team_share, oreb_rate, out=team_share)
+        scoring_poss *= team_share
+        scoring_poss += OREB_PART
+        self._buffer_pool.release(team_share, oreb_rate)
+        return scoring_poss
+
+    @_scalar_or_array
     def missed_fg_possessions(
         self,
         FGA: ArrayLike,
         FGM: ArrayLike,
         TEAM_OREB: ArrayLike,
         OPP_DREB: ArrayLike,
+        TEAM_OREB_PCT: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1841,23 +2896,16 @@ class PlayerStats(Stats):
             FGM (ArrayLike): field goal makes\n
             TEAM_OREB (ArrayLike): team offensive rebounds\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            TEAM_OREB_PCT (ArrayLike, optional): precomputed team OREB%.\n
 
         Returns:
             ArrayLike: Missed Field Goal Possessions.
         """
-        return np.multiply(
-            np.subtract(FGA, FGM),
-            np.subtract(
-                1,
-                np.multiply(
-                    1.07,
-                    self.team_stats.offensive_rebound_pct(
-                        OREB=TEAM_OREB, OPP_DREB=OPP_DREB
-                    ),
-                ),
-            ),
-        )
+        if TEAM_OREB_PCT is None:
+            TEAM_OREB_PCT = self._team_oreb_pct(TEAM_OREB=TEAM_OREB, OPP_DREB=OPP_DREB)
+        return (FGA - FGM) * (1 - 1.07 * TEAM_OREB_PCT)
 
+    @_scalar_or_array
     def missed_ft_possessions(self, FTA: ArrayLike, FTM: ArrayLike, **_) -> ArrayLike:
         """
         Missed Free Throw Possessions component of Individual Total Possessions.
@@ -1875,11 +2923,10 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: Missed Free Throw Possessions.
         """
-        return np.multiply(
-            np.subtract(1, np.power(np.divide(FTM, FTA), 2)),
-            np.multiply(self._ft_weight, FTA),
-        )
+        # (1 - (FTM / FTA)**2) * FTA == (FTA - FTM) * (FTA + FTM) / FTA
+        return _safe_divide(self._ft_weight * (FTA - FTM) * (FTA + FTM), FTA)
 
+    @_scalar_or_array
     def total_possessions(
         self,
         PTS: ArrayLike,
@@ -1901,6 +2948,14 @@ class PlayerStats(Stats):
         TEAM_TOV: ArrayLike,
         TEAM_MP: ArrayLike,
         OPP_DREB: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        TEAM_SCORING_POSS: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        TEAM_OREB_PCT: ArrayLike = None,
+        SCORING_POSS: ArrayLike = None,
+        QAST: ArrayLike = None,
+        OREB_PART: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -1932,46 +2987,71 @@ class PlayerStats(Stats):
             TEAM_TOV (ArrayLike): team turnovers\n
             TEAM_MP (ArrayLike): team minutes played\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            TEAM_OREB_PCT (ArrayLike, optional): precomputed team OREB%.\n
+            SCORING_POSS (ArrayLike, optional): precomputed scoring possessions.\n
+            QAST (ArrayLike, optional): precomputed _qAST.\n
+            OREB_PART (ArrayLike, optional): precomputed _oreb_part.\n
 
         Returns:
             ArrayLike: Total Possessions.
         """
-        scoring_possessions = self._scoring_possessions(
-            PTS=PTS,
+        if TEAM_OREB_PCT is None:
+            TEAM_OREB_PCT = self._team_oreb_pct(TEAM_OREB=TEAM_OREB, OPP_DREB=OPP_DREB)
+        if SCORING_POSS is None:
+            SCORING_POSS = self._scoring_possessions(
+                PTS=PTS,
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                FTM=FTM,
+                OREB=OREB,
+                AST=AST,
+                MP=MP,
+                TEAM_PTS=TEAM_PTS,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_AST=TEAM_AST,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_MP=TEAM_MP,
+                OPP_DREB=OPP_DREB,
+                MP_SHARE=MP_SHARE,
+                QAST=QAST,
+                TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                TEAM_OREB_PCT=TEAM_OREB_PCT,
+                OREB_PART=OREB_PART,
+            )
+        missed_fg_possessions = self.missed_fg_possessions(
             FGA=FGA,
             FGM=FGM,
-            FTA=FTA,
-            FTM=FTM,
-            OREB=OREB,
-            AST=AST,
-            MP=MP,
-            TEAM_PTS=TEAM_PTS,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
             TEAM_OREB=TEAM_OREB,
-            TEAM_AST=TEAM_AST,
-            TEAM_TOV=TEAM_TOV,
-            TEAM_MP=TEAM_MP,
             OPP_DREB=OPP_DREB,
-        )
-        missed_fg_possessions = self.missed_fg_possessions(
-            FGA=FGA, FGM=FGM, TEAM_OREB=TEAM_OREB, OPP_DREB=OPP_DREB
+            TEAM_OREB_PCT=TEAM_OREB_PCT,
         )
         missed_ft_possessions = self.missed_ft_possessions(FTA=FTA, FTM=FTM)
-        return np.sum(
-            np.array(
-                [
-                    scoring_possessions,
-                    missed_fg_possessions,
-                    missed_ft_possessions,
-                    TOV,
-                ],
-            ),
-            axis=0,
-        )
-
+        # Accumulate into the missed FG possessions array, which this call owns,
+        # first widened to the shape every term broadcasts to
+        shape, dtype = _broadcast_spec(
+            missed_fg_possessions, SCORING_POSS, missed_ft_possessions, TOV
+        )
+        if np.shape(missed_fg_possessions) != shape:
+            missed_fg_possessions = self.xp.broadcast_to(
+                missed_fg_possessions, shape
+            ).astype(dtype)
+        missed_fg_possessions += SCORING_POSS
+        missed_fg_possessions += missed_ft_possessions
+        missed_fg_possessions += TOV
+        return missed_fg_possessions
+
+    @_scalar_or_array
     def _pprod_fg_part(
         self,
         PTS: ArrayLike,
@@ -1984,6 +3064,8 @@ class PlayerStats(Stats):
         TEAM_FGM: ArrayLike,
         TEAM_AST: ArrayLike,
         TEAM_MP: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        QAST: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -2006,31 +3088,27 @@ class PlayerStats(Stats):
             TEAM_FGM (ArrayLike): team field goal makes\n
             TEAM_AST (ArrayLike): team assists\n
             TEAM_MP (ArrayLike): team minutes played\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            QAST (ArrayLike, optional): precomputed _qAST.\n
 
         Returns:
             ArrayLike: Field Goal Part of Individual Points Produced.
         """
-        qAST = self._qAST(
-            FGM=FGM,
-            AST=AST,
-            MP=MP,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_AST=TEAM_AST,
-            TEAM_MP=TEAM_MP,
-        )
-        return np.multiply(
-            np.multiply(2, np.multiply(np.add(FGM, 0.5), FG3M)),
-            np.multiply(
-                np.subtract(
-                    1,
-                    np.multiply(
-                        0.5, np.divide(np.subtract(PTS, FTM), np.multiply(2, FGA))
-                    ),
-                ),
-                qAST,
-            ),
+        if QAST is None:
+            QAST = self._qAST(
+                FGM=FGM,
+                AST=AST,
+                MP=MP,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_AST=TEAM_AST,
+                TEAM_MP=TEAM_MP,
+                MP_SHARE=MP_SHARE,
+            )
+        return (2 * ((FGM + 0.5) * FG3M)) * (
+            (1 - 0.5 * _safe_divide(PTS - FTM, 2 * FGA)) * QAST
         )
 
+    @_scalar_or_array
     def _pprod_ast_part(
         self,
         PTS: ArrayLike,
@@ -2071,23 +3149,15 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: Assist Part of Individual Points Produced.
         """
-        return np.multiply(
-            np.multiply(
-                np.divide(
-                    np.multiply(
-                        np.add(np.subtract(TEAM_FGM, FGM), 0.5),
-                        np.subtract(TEAM_FG3M, FG3M),
-                    ),
-                    np.subtract(TEAM_FGM, FGM),
-                ),
-                np.divide(
-                    np.subtract(np.subtract(TEAM_PTS, TEAM_FTM), np.subtract(PTS, FTM)),
-                    np.multiply(2, np.subtract(TEAM_FGA, FGA)),
-                ),
-            ),
-            AST,
+        return (
+            (TEAM_FGM - FGM + 0.5)
+            * (TEAM_FG3M - FG3M)
+            / (TEAM_FGM - FGM)
+            * ((TEAM_PTS - TEAM_FTM - (PTS - FTM)) / (2 * (TEAM_FGA - FGA)))
+            * AST
         )
 
+    @_scalar_or_array
     def _pprod_oreb_part(
         self,
         OREB: ArrayLike,
@@ -2099,11 +3169,14 @@ class PlayerStats(Stats):
         TEAM_OREB: ArrayLike,
         TEAM_TOV: ArrayLike,
         OPP_DREB: ArrayLike,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_SCORING_POSS: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
         Offensive Rebound Part of Individual Points Produced.
-            PPROD_OREB_PART = OREB * TEAM_OREB_WEIGHT * TEAM_SCORE_RATE * (TEAM_PTS / (TEAM_FGM + (1 - 1 - (TEAM_FTM / TEAM_FTA))**2) * 0.44 * TEAM_FTA)))))
+            PPROD_OREB_PART = OREB * TEAM_OREB_WEIGHT * TEAM_SCORE_RATE * (TEAM_PTS / (TEAM_FGM + (1 - (1 - (TEAM_FTM / TEAM_FTA))**2) * 0.44 * TEAM_FTA))
 
         Source(s):
             - https://www.basketball-reference.com/about/ratings.html
@@ -2120,6 +3193,9 @@ class PlayerStats(Stats):
             TEAM_OREB (ArrayLike): team offensive rebounds\n
             TEAM_TOV (ArrayLike): team turnovers\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
 
         Returns:
             ArrayLike: Offensive Rebound Part of Individual Points Produced.
@@ -2133,24 +3209,16 @@ class PlayerStats(Stats):
             TEAM_OREB=TEAM_OREB,
             TEAM_TOV=TEAM_TOV,
             OPP_DREB=OPP_DREB,
+            TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+            TEAM_SCORE_RATE=TEAM_SCORE_RATE,
         )
-        return np.multiply(
-            oreb_part,
-            np.multiply(
-                np.divide(
-                    TEAM_PTS,
-                    np.add(
-                        TEAM_FGM,
-                        np.subtract(
-                            1,
-                            np.subtract(1, np.power(np.divide(TEAM_FTM, TEAM_FTA), 2)),
-                        ),
-                    ),
-                ),
-                np.multiply(self._ft_weight, TEAM_FTA),
-            ),
-        )
+        if TEAM_SCORING_POSS is None:  # The denominator is TEAM_SCORING_POSS
+            TEAM_SCORING_POSS = self._team_scoring_possessions(
+                TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
+            )
+        return oreb_part * (TEAM_PTS / TEAM_SCORING_POSS)
 
+    @_scalar_or_array
     def points_produced(
         self,
         PTS: ArrayLike,
@@ -2172,6 +3240,12 @@ class PlayerStats(Stats):
         TEAM_TOV: ArrayLike,
         TEAM_MP: ArrayLike,
         OPP_DREB: ArrayLike,
+        MP_SHARE: ArrayLike = None,
+        TEAM_SCORING_POSS: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        QAST: ArrayLike = None,
+        OREB_PART: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -2204,10 +3278,41 @@ class PlayerStats(Stats):
             TEAM_TOV (ArrayLike): team turnovers\n
             TEAM_MP (ArrayLike): team minutes played\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            QAST (ArrayLike, optional): precomputed _qAST.\n
+            OREB_PART (ArrayLike, optional): precomputed _oreb_part.\n
 
         Returns:
             ArrayLike: Individual Points Produced.
         """
+        # Shared team terms are computed once and threaded through the helpers
+        if TEAM_SCORING_POSS is None:
+            TEAM_SCORING_POSS = self._team_scoring_possessions(
+                TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
+            )
+        if TEAM_SCORE_RATE is None:
+            TEAM_SCORE_RATE = self._team_score_rate(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+            )
+        if TEAM_OREB_WEIGHT is None:
+            TEAM_OREB_WEIGHT = self._team_oreb_weight(
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_TOV=TEAM_TOV,
+                OPP_DREB=OPP_DREB,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+            )
         fg_part = self._pprod_fg_part(
             PTS=PTS,
             FGA=FGA,
@@ -2219,6 +3324,8 @@ class PlayerStats(Stats):
             TEAM_FGM=TEAM_FGM,
             TEAM_AST=TEAM_AST,
             TEAM_MP=TEAM_MP,
+            QAST=QAST,
+            MP_SHARE=MP_SHARE,
         )
         ast_part = self._pprod_ast_part(
             PTS=PTS,
@@ -2233,67 +3340,54 @@ class PlayerStats(Stats):
             TEAM_FTM=TEAM_FTM,
             TEAM_FG3M=TEAM_FG3M,
         )
-        team_scoring_possessions = self._team_scoring_possessions(
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-        )
-        team_oreb_weight = self._team_oreb_weight(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_TOV=TEAM_TOV,
-            OPP_DREB=OPP_DREB,
-        )
-        team_score_rate = self._team_score_rate(
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_TOV=TEAM_TOV,
-        )
-        pprod_oreb_part = self._pprod_oreb_part(
-            OREB=OREB,
-            TEAM_PTS=TEAM_PTS,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_TOV=TEAM_TOV,
-            OPP_DREB=OPP_DREB,
-        )
-        return np.add(
-            np.multiply(
-                np.sum(
-                    np.array(
-                        [
-                            fg_part,
-                            ast_part,
-                            FTM,
-                        ]
-                    ),
-                    axis=0,
-                ),
-                np.multiply(
-                    np.multiply(
-                        np.subtract(
-                            1,
-                            np.divide(
-                                TEAM_OREB,
-                                team_scoring_possessions,
-                            ),
-                        ),
-                        team_oreb_weight,
-                    ),
-                    team_score_rate,
-                ),
-            ),
-            pprod_oreb_part,
-        )
-
+        if OREB_PART is None:
+            OREB_PART = self._oreb_part(
+                OREB=OREB,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_TOV=TEAM_TOV,
+                OPP_DREB=OPP_DREB,
+                TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+            )
+        shape, dtype = _broadcast_spec(
+            fg_part,
+            ast_part,
+            FTM,
+            OREB_PART,
+            TEAM_OREB,
+            TEAM_PTS,
+            TEAM_SCORING_POSS,
+            TEAM_OREB_WEIGHT,
+            TEAM_SCORE_RATE,
+        )
+        if not shape:  # Scalar and 0-d results cannot be written in place
+            return (fg_part + ast_part + FTM) * (
+                (1 - TEAM_OREB / TEAM_SCORING_POSS) * TEAM_OREB_WEIGHT * TEAM_SCORE_RATE
+            ) + OREB_PART * (TEAM_PTS / TEAM_SCORING_POSS)
+        # Combined in place: one output array plus pooled scratch buffers. Both
+        # TEAM_OREB and TEAM_PTS (PProd_OREB_Part) are divided by TEAM_SCORING_POSS,
+        # so its reciprocal is taken once and multiplied instead.
+        pprod = np.add(fg_part, ast_part, out=self.xp.empty(shape, dtype))
+        pprod += FTM
+        inv_scoring_poss = self._buffer_pool.get(shape, dtype)
+        team_share = self._buffer_pool.get(shape, dtype)
+        np.divide(1, TEAM_SCORING_POSS, out=inv_scoring_poss)
+        np.multiply(TEAM_OREB, inv_scoring_poss, out=team_share)
+        np.subtract(1, team_share, out=team_share)
+        team_share *= TEAM_OREB_WEIGHT
+        team_share *= TEAM_SCORE_RATE
+        pprod *= team_share
+        np.multiply(TEAM_PTS, inv_scoring_poss, out=team_share)
+        team_share *= OREB_PART
+        pprod += team_share
+        self._buffer_pool.release(inv_scoring_poss, team_share)
+        return pprod
+
+    @_scalar_or_array
     def offensive_rating(
         self,
         PTS: ArrayLike,
@@ -2317,6 +3411,15 @@ class PlayerStats(Stats):
         TEAM_TOV: ArrayLike,
         TEAM_MP: ArrayLike,
         OPP_DREB: ArrayLike,
+        PPROD: ArrayLike = None,
+        TOT_POSS: ArrayLike = None,
+        MP_SHARE: ArrayLike = None,
+        TEAM_SCORING_POSS: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        TEAM_OREB_PCT: ArrayLike = None,
+        QAST: ArrayLike = None,
+        OREB_PART: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -2351,60 +3454,137 @@ class PlayerStats(Stats):
             TEAM_TOV (ArrayLike): team turnovers\n
             TEAM_MP (ArrayLike): team minutes played\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            PPROD (ArrayLike, optional): precomputed points produced.\n
+            TOT_POSS (ArrayLike, optional): precomputed total possessions.\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            TEAM_OREB_PCT (ArrayLike, optional): precomputed team OREB%.\n
+            QAST (ArrayLike, optional): precomputed _qAST.\n
+            OREB_PART (ArrayLike, optional): precomputed _oreb_part.\n
 
         Returns:
             ArrayLike: player offensive rating.
         """
-        individual_points_produced = self.points_produced(
-            PTS=PTS,
-            FGA=FGA,
-            FGM=FGM,
-            FG3M=FG3M,
-            FTM=FTM,
-            OREB=OREB,
-            AST=AST,
-            MP=MP,
-            TEAM_PTS=TEAM_PTS,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FG3M=TEAM_FG3M,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_AST=TEAM_AST,
-            TEAM_TOV=TEAM_TOV,
-            TEAM_MP=TEAM_MP,
-            OPP_DREB=OPP_DREB,
-        )
-        total_possessions = self.total_possessions(
-            PTS=PTS,
-            FGA=FGA,
-            FGM=FGM,
-            FTA=FTA,
-            FTM=FTM,
-            OREB=OREB,
-            AST=AST,
-            TOV=TOV,
-            MP=MP,
-            TEAM_PTS=TEAM_PTS,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_AST=TEAM_AST,
-            TEAM_TOV=TEAM_TOV,
-            TEAM_MP=TEAM_MP,
-            OPP_DREB=OPP_DREB,
-        )
-        return np.multiply(
-            100,
-            np.divide(
-                individual_points_produced,
-                total_possessions,
-            ),
-        )
-
+        if PPROD is None or TOT_POSS is None:
+            # Terms shared by points produced and total possessions
+            if TEAM_OREB_PCT is None:
+                TEAM_OREB_PCT = self._team_oreb_pct(
+                    TEAM_OREB=TEAM_OREB, OPP_DREB=OPP_DREB
+                )
+            if TEAM_SCORING_POSS is None:
+                TEAM_SCORING_POSS = self._team_scoring_possessions(
+                    TEAM_FGM=TEAM_FGM, TEAM_FTA=TEAM_FTA, TEAM_FTM=TEAM_FTM
+                )
+            if TEAM_SCORE_RATE is None:
+                TEAM_SCORE_RATE = self._team_score_rate(
+                    TEAM_FGA=TEAM_FGA,
+                    TEAM_FGM=TEAM_FGM,
+                    TEAM_FTA=TEAM_FTA,
+                    TEAM_FTM=TEAM_FTM,
+                    TEAM_TOV=TEAM_TOV,
+                    TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+                )
+            if TEAM_OREB_WEIGHT is None:
+                TEAM_OREB_WEIGHT = self._team_oreb_weight(
+                    TEAM_FGA=TEAM_FGA,
+                    TEAM_FGM=TEAM_FGM,
+                    TEAM_FTA=TEAM_FTA,
+                    TEAM_FTM=TEAM_FTM,
+                    TEAM_OREB=TEAM_OREB,
+                    TEAM_TOV=TEAM_TOV,
+                    OPP_DREB=OPP_DREB,
+                    TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                    TEAM_OREB_PCT=TEAM_OREB_PCT,
+                )
+            if OREB_PART is None:
+                OREB_PART = self._oreb_part(
+                    OREB=OREB,
+                    TEAM_FGA=TEAM_FGA,
+                    TEAM_FGM=TEAM_FGM,
+                    TEAM_FTA=TEAM_FTA,
+                    TEAM_FTM=TEAM_FTM,
+                    TEAM_OREB=TEAM_OREB,
+                    TEAM_TOV=TEAM_TOV,
+                    OPP_DREB=OPP_DREB,
+                    TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                    TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                )
+            if MP_SHARE is None:
+                MP_SHARE = self._minutes_share(MP=MP, TEAM_MP=TEAM_MP)
+            if QAST is None:
+                QAST = self._qAST(
+                    FGM=FGM,
+                    AST=AST,
+                    MP=MP,
+                    TEAM_FGM=TEAM_FGM,
+                    TEAM_AST=TEAM_AST,
+                    TEAM_MP=TEAM_MP,
+                    MP_SHARE=MP_SHARE,
+                )
+        if PPROD is None:
+            PPROD = self.points_produced(
+                PTS=PTS,
+                FGA=FGA,
+                FGM=FGM,
+                FG3M=FG3M,
+                FTM=FTM,
+                OREB=OREB,
+                AST=AST,
+                MP=MP,
+                TEAM_PTS=TEAM_PTS,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FG3M=TEAM_FG3M,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_AST=TEAM_AST,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_MP=TEAM_MP,
+                OPP_DREB=OPP_DREB,
+                MP_SHARE=MP_SHARE,
+                QAST=QAST,
+                TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                OREB_PART=OREB_PART,
+            )
+        if TOT_POSS is None:
+            TOT_POSS = self.total_possessions(
+                PTS=PTS,
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                FTM=FTM,
+                OREB=OREB,
+                AST=AST,
+                TOV=TOV,
+                MP=MP,
+                TEAM_PTS=TEAM_PTS,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_AST=TEAM_AST,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_MP=TEAM_MP,
+                OPP_DREB=OPP_DREB,
+                MP_SHARE=MP_SHARE,
+                QAST=QAST,
+                TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                TEAM_OREB_PCT=TEAM_OREB_PCT,
+                OREB_PART=OREB_PART,
+            )
+        offensive_rating = _safe_divide(PPROD, TOT_POSS)  # 0 without possessions
+        offensive_rating *= 100
+        return offensive_rating
+
+    @_scalar_or_array
     def floor_pct(
         self,
         PTS: ArrayLike,
@@ -2426,6 +3606,13 @@ class PlayerStats(Stats):
         TEAM_TOV: ArrayLike,
         TEAM_MP: ArrayLike,
         OPP_DREB: ArrayLike,
+        SCORING_POSS: ArrayLike = None,
+        TOT_POSS: ArrayLike = None,
+        MP_SHARE: ArrayLike = None,
+        TEAM_SCORING_POSS: ArrayLike = None,
+        TEAM_SCORE_RATE: ArrayLike = None,
+        TEAM_OREB_WEIGHT: ArrayLike = None,
+        TEAM_OREB_PCT: ArrayLike = None,
         **_
     ) -> ArrayLike:
         """
@@ -2460,76 +3647,92 @@ class PlayerStats(Stats):
             TEAM_TOV (ArrayLike): team turnovers\n
             TEAM_MP (ArrayLike): team minutes played\n
             OPP_DREB (ArrayLike): opponent defensive rebounds\n
+            SCORING_POSS (ArrayLike, optional): precomputed scoring possessions.\n
+            TOT_POSS (ArrayLike, optional): precomputed total possessions.\n
+            MP_SHARE (ArrayLike, optional): precomputed MP / (TEAM_MP / 5).\n
+            TEAM_SCORING_POSS (ArrayLike, optional): precomputed team scoring poss.\n
+            TEAM_SCORE_RATE (ArrayLike, optional): precomputed team score rate.\n
+            TEAM_OREB_WEIGHT (ArrayLike, optional): precomputed team OREB weight.\n
+            TEAM_OREB_PCT (ArrayLike, optional): precomputed team OREB%.\n
 
         Returns:
             ArrayLike: Floor Percentage.
         """
-        player_scoring_possessions = self._scoring_possessions(
-            PTS=PTS,
-            FGA=FGA,
-            FGM=FGM,
-            FTA=FTA,
-            FTM=FTM,
-            OREB=OREB,
-            AST=AST,
-            MP=MP,
-            TEAM_PTS=TEAM_PTS,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_AST=TEAM_AST,
-            TEAM_TOV=TEAM_TOV,
-            TEAM_MP=TEAM_MP,
-            OPP_DREB=OPP_DREB,
-        )
-        total_possessions = self.total_possessions(
-            PTS=PTS,
-            FGA=FGA,
-            FGM=FGM,
-            FTA=FTA,
-            FTM=FTM,
-            OREB=OREB,
-            AST=AST,
-            TOV=TOV,
-            MP=MP,
-            TEAM_PTS=TEAM_PTS,
-            TEAM_FGA=TEAM_FGA,
-            TEAM_FGM=TEAM_FGM,
-            TEAM_FTA=TEAM_FTA,
-            TEAM_FTM=TEAM_FTM,
-            TEAM_OREB=TEAM_OREB,
-            TEAM_AST=TEAM_AST,
-            TEAM_TOV=TEAM_TOV,
-            TEAM_MP=TEAM_MP,
-            OPP_DREB=OPP_DREB,
-        )
-        return np.divide(
-            player_scoring_possessions,
-            total_possessions,
-        )
+        # Scoring possessions are shared with total possessions, not recomputed
+        if TEAM_OREB_PCT is None:
+            TEAM_OREB_PCT = self._team_oreb_pct(TEAM_OREB=TEAM_OREB, OPP_DREB=OPP_DREB)
+        if SCORING_POSS is None:
+            SCORING_POSS = self._scoring_possessions(
+                PTS=PTS,
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                FTM=FTM,
+                OREB=OREB,
+                AST=AST,
+                MP=MP,
+                TEAM_PTS=TEAM_PTS,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_AST=TEAM_AST,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_MP=TEAM_MP,
+                OPP_DREB=OPP_DREB,
+                MP_SHARE=MP_SHARE,
+                TEAM_SCORING_POSS=TEAM_SCORING_POSS,
+                TEAM_SCORE_RATE=TEAM_SCORE_RATE,
+                TEAM_OREB_WEIGHT=TEAM_OREB_WEIGHT,
+                TEAM_OREB_PCT=TEAM_OREB_PCT,
+            )
+        if TOT_POSS is None:
+            TOT_POSS = self.total_possessions(
+                PTS=PTS,
+                FGA=FGA,
+                FGM=FGM,
+                FTA=FTA,
+                FTM=FTM,
+                OREB=OREB,
+                AST=AST,
+                TOV=TOV,
+                MP=MP,
+                TEAM_PTS=TEAM_PTS,
+                TEAM_FGA=TEAM_FGA,
+                TEAM_FGM=TEAM_FGM,
+                TEAM_FTA=TEAM_FTA,
+                TEAM_FTM=TEAM_FTM,
+                TEAM_OREB=TEAM_OREB,
+                TEAM_AST=TEAM_AST,
+                TEAM_TOV=TEAM_TOV,
+                TEAM_MP=TEAM_MP,
+                OPP_DREB=OPP_DREB,
+                TEAM_OREB_PCT=TEAM_OREB_PCT,
+                SCORING_POSS=SCORING_POSS,
+            )
+        return _safe_divide(SCORING_POSS, TOT_POSS)
 
     def _stops1(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def _stops2(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def stops(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def defensive_rating(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def win_shares(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def off_win_shares(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def def_win_shares(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def box_plus_minus(self) -> ArrayLike:
         """
@@ -2557,10 +3760,10 @@ class PlayerStats(Stats):
 
 
         """
-        return []
+        return _EMPTY
 
     def value_over_replacement(self) -> ArrayLike:
-        return []
+        return _EMPTY
 
     def wins_above_replacement(self) -> ArrayLike:
         """
@@ -2571,8 +3774,9 @@ class PlayerStats(Stats):
         Created by Kevin Pelton.
         Source: http://www.sonicscentral.com/warp.html
         """
-        return []
+        return _EMPTY
 
+    @_scalar_or_array
     def game_score(
         self,
         PTS: ArrayLike,
@@ -2587,6 +3791,7 @@ class PlayerStats(Stats):
         BLK: ArrayLike,
         PF: ArrayLike,
         TOV: ArrayLike,
+        **_
     ) -> ArrayLike:
         """
         Game Score (GAME_SCORE)
@@ -2613,44 +3818,16 @@ class PlayerStats(Stats):
         Returns:
             ArrayLike: game score
         """
-        return np.sum(
-            np.array(
-                [
-                    PTS,
-                    np.multiply(FGM, 0.4),
-                    np.multiply(FGA, -0.7),
-                    np.multiply(np.subtract(FTA, FTM), -0.4),
-                    np.multiply(OREB, 0.7),
-                    np.multiply(DREB, 0.3),
-                    STL,
-                    np.multiply(AST, 0.7),
-                    np.multiply(BLK, 0.7),
-                    np.multiply(PF, -0.4),
-                    np.multiply(TOV, -1),
-                ]
-            ),
-            axis=0,
+        # Terms sharing a weight are summed first: three multiplies instead of eight
+        return (
+            PTS
+            + 0.4 * (FGM - (FTA - FTM) - PF)
+            + 0.7 * (OREB + AST + BLK - FGA)
+            + 0.3 * DREB
+            + STL
+            - TOV
         )
 
-    def _get_required_stat_params(self) -> List[str]:
-        """
-        Aggregate list of required parameters for all statistics
-        this class can compute.
-
-        Returns:
-            List[str]: list of all possible required parameters.
-        """
-        all_stat_methods = {
-            **self.independent_stat_method_map,
-            **self.dependent_stat_method_map,
-        }
-        all_params = []
-        for stat_func in all_stat_methods.values():
-            all_params.extend(inspect.getfullargspec(stat_func).args)
-        all_params = sorted(np.unique(all_params))
-        all_params.remove("self")
-        return all_params
-
 
 if __name__ == "__main__":
     pass
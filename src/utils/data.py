@@ -2,9 +2,10 @@
 # Imports
 import os
 import time
+import functools
+import random
 import pickle
 from typing import Union, List, Dict, Tuple, Callable
-from cachetools import TTLCache
 import requests
 import pandas as pd
 
@@ -33,6 +34,36 @@ def manage_path(func: Callable):
     return save_wrapper
 
 
+@manage_path
+def save_data(data, folder: str, name: str) -> bool:
+    """
+    Save data to desired location.
+    pandas DataFrames/Series are saves as parquet files.
+
+    Args:
+        data (_type_): data to be saved.
+            If pandas DataFrame/Series, columns must be strings.
+            If other, must be pickleable.
+        folder (str): folder to store data. Cannot start with '/'.
+        name (str): name of file to store data.
+
+    Returns:
+        bool: True/False depending on success.
+    """
+    if isinstance(data, pd.DataFrame):
+        if name.split(".")[-1] != "parquet":
+            name += ".parquet"
+        pth = os.path.join(folder, name)
+        data.to_parquet(pth)
+        return True
+    elif name.split(".")[-1] != "pickle":
+        name += ".pickle"
+    pth = os.path.join(folder, name)
+    with open(pth, "wb") as handle:
+        pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    return True
+
+
 def load_data(pth: str) -> Union[Dict, List, Tuple, None]:
     """Load data using pickle.
 
@@ -51,12 +82,24 @@ def load_data(pth: str) -> Union[Dict, List, Tuple, None]:
         return None
 
 
-def retry(func: Callable, retries=3):
+def _retry_delay(error: Exception, attempt: int, backoff: float) -> float:
+    """Seconds to wait before retrying: the server's Retry-After if it sent one,
+    else exponential backoff with up to a second of jitter."""
+    response = getattr(error, "response", None)
+    retry_after = None if response is None else response.headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    return backoff * 2**attempt + random.uniform(0, 1)
+
+
+def retry(func: Callable, retries=3, backoff=5.0):
     """Retry wrapper for requests to bypass throttling.
 
     Args:
         func (Callable): method to be retried.
         retries (int, optional): max. number retries. Defaults to 3.
+        backoff (float, optional): seconds to wait after the first failure, doubled
+            after each further failure. Defaults to 5.0.
     """
 
     def retry_wrapper(*args, **kwargs):
@@ -66,8 +109,9 @@ def retry(func: Callable, retries=3):
                 return func(*args, **kwargs)
             except requests.exceptions.RequestException as e:
                 print(e)
-                time.sleep(30)
                 attempts += 1
+                if attempts < retries:  # No point waiting after the last attempt
+                    time.sleep(_retry_delay(e, attempts - 1, backoff))
 
     return retry_wrapper
 
@@ -82,4 +126,26 @@ def join_str(s: str) -> str:
     return "".join(s.split())
 
 
-cache = TTLCache(maxsize=128, ttl=300)  # TODO: improve cache
+def ttl_cache(maxsize: int = 128, ttl: float = 300):
+    """Memoize a function with functools.lru_cache, expiring all entries every ttl
+    seconds.
+
+    Args:
+        maxsize (int, optional): max. number of cached results. Defaults to 128.
+        ttl (float, optional): seconds cached results stay fresh. Defaults to 300.
+    """
+
+    def decorator(func: Callable):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached_func(ttl_period, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def ttl_wrapper(*args, **kwargs):
+            # Calls in a new ttl period miss the cache, so stale results are never hit
+            return cached_func(int(time.monotonic() // ttl), *args, **kwargs)
+
+        ttl_wrapper.cache_clear = cached_func.cache_clear  # type: ignore
+        return ttl_wrapper
+
+    return decorator
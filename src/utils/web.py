@@ -1,27 +1,48 @@
 """
 Methods in this file are used to open URLs in a web browser to assist with data inputation.
 """
-from typing import List
-from urllib.request import urlopen
-from urllib.error import HTTPError
+from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
 import webbrowser as web
 import validators
 
 
-def open_url(urls: List[str]) -> None:
+def _probe_url(url: str, timeout: float) -> Union[str, Exception, None]:
+    """Check that a URL responds, requesting its headers only. Returns the error."""
+    if not validators.url(url):  # type: ignore
+        return "Validation Error"
+    try:
+        try:
+            urlopen(Request(url, method="HEAD"), timeout=timeout).close()
+        except HTTPError as e:
+            if e.code != 405:  # Method Not Allowed: server only answers GET
+                raise
+            urlopen(url, timeout=timeout).close()
+        return None
+    except (URLError, OSError) as e:  # OSError: socket timeout while reading
+        return e
+
+
+def open_url(urls: List[str], timeout: float = 10) -> None:
     """
     Open URL in web browser. If first URL doesn't work, try second, so on and so forth.
+    All URLs are probed concurrently, so failures don't add up their round trips, and
+    probes still pending once a URL is opened are abandoned.
     """
     errors = []
-    for url in urls:
-        try:
-            if validators.url(url):  # type: ignore
-                html = urlopen(url)
+    executor = ThreadPoolExecutor(max_workers=max(len(urls), 1))
+    futures = [executor.submit(_probe_url, url, timeout) for url in urls]
+    try:
+        for url, future in zip(urls, futures):
+            error = future.result()
+            if error is None:
                 web.open(url)
-                html.close()
+                for pending in futures:
+                    pending.cancel()
                 return
-            else:
-                errors.append("Validation Error")
-        except HTTPError as e:
-            errors.append(e)
+            errors.append(error)
+    finally:
+        executor.shutdown(wait=False)
     print(f"No valid URLs: {errors}")
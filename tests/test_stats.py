@@ -0,0 +1,313 @@
+"""Tests for stat formulas evaluated on scalars, numpy scalars and arrays."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from features.stats import PlayerStats, TeamStats
+
+FOUR_FACTOR_INPUTS = dict(
+    FGA=85, FGM=40, FG3M=12, FTA=20, FTM=15, REB=43, OPP_REB=41, TOV=12
+)
+FOUR_FACTORS = dict(
+    SHOOTING_FACTOR="shooting_factor",
+    TOV_FACTOR="turnover_factor",
+    REB_FACTOR="rebound_factor",
+    FT_FACTOR="free_throw_factor",
+)
+
+
+@pytest.mark.parametrize("factor", list(FOUR_FACTORS))
+def test_four_factor_score_broadcasts_any_factor(factor):
+    team_stats = TeamStats()
+    expected = team_stats.four_factor_score(**FOUR_FACTOR_INPUTS)
+    inputs = {key: [value] for key, value in FOUR_FACTOR_INPUTS.items()}
+    inputs[factor] = [
+        getattr(team_stats, FOUR_FACTORS[factor])(**FOUR_FACTOR_INPUTS)
+    ] * 3
+    np.testing.assert_allclose(
+        team_stats.four_factor_score(**inputs), np.full(3, expected), rtol=1e-5
+    )
+    scalars = {key: np.float32(value) for key, value in FOUR_FACTOR_INPUTS.items()}
+    assert team_stats.four_factor_score(**scalars) == pytest.approx(expected, rel=1e-5)
+
+
+TEAM_POSSESSIONS_INPUTS = dict(FGA=85, FGM=40, FTA=20, OREB=10, OPP_DREB=30, TOV=12)
+
+
+@pytest.mark.parametrize("name", list(TEAM_POSSESSIONS_INPUTS))
+def test_team_possessions_broadcasts_any_array_input(name):
+    team_stats = TeamStats()
+    expected = team_stats._team_possessions(**TEAM_POSSESSIONS_INPUTS)
+    inputs = dict(
+        TEAM_POSSESSIONS_INPUTS,
+        **{name: np.full(3, TEAM_POSSESSIONS_INPUTS[name], np.float64)},
+    )
+    np.testing.assert_allclose(
+        team_stats._team_possessions(**inputs), np.full(3, expected), rtol=1e-6
+    )
+    scalars = {key: np.int64(value) for key, value in TEAM_POSSESSIONS_INPUTS.items()}
+    assert team_stats._team_possessions(**scalars) == pytest.approx(expected, rel=1e-6)
+
+
+QAST_INPUTS = dict(FGM=8, AST=5, MP=30, TEAM_FGM=40, TEAM_AST=25, TEAM_MP=240)
+TEAM_OREB_WEIGHT_INPUTS = dict(
+    TEAM_FGA=85,
+    TEAM_FGM=40,
+    TEAM_FTA=20,
+    TEAM_FTM=15,
+    TEAM_OREB=10,
+    TEAM_TOV=12,
+    OPP_DREB=30,
+)
+
+
+@pytest.mark.parametrize("name", list(QAST_INPUTS))
+def test_qAST_broadcasts_any_array_input(name):
+    player_stats = PlayerStats()
+    expected = player_stats._qAST(**QAST_INPUTS)
+    inputs = dict(QAST_INPUTS, **{name: np.full(3, QAST_INPUTS[name], np.float64)})
+    np.testing.assert_allclose(player_stats._qAST(**inputs), np.full(3, expected))
+    scalars = {key: np.float32(value) for key, value in QAST_INPUTS.items()}
+    assert player_stats._qAST(**scalars) == pytest.approx(expected, rel=1e-6)
+
+
+@pytest.mark.parametrize("name", list(TEAM_OREB_WEIGHT_INPUTS))
+def test_team_oreb_weight_broadcasts_any_array_input(name):
+    player_stats = PlayerStats()
+    expected = player_stats._team_oreb_weight(**TEAM_OREB_WEIGHT_INPUTS)
+    inputs = dict(
+        TEAM_OREB_WEIGHT_INPUTS,
+        **{name: np.full(3, TEAM_OREB_WEIGHT_INPUTS[name], np.float64)},
+    )
+    np.testing.assert_allclose(
+        player_stats._team_oreb_weight(**inputs), np.full(3, expected), rtol=1e-6
+    )
+
+
+FLOOR_PCT_INPUTS = dict(
+    PTS=20,
+    FGA=15,
+    FGM=8,
+    FTA=5,
+    FTM=3,
+    OREB=2,
+    AST=5,
+    TOV=2,
+    MP=30,
+    TEAM_PTS=110,
+    TEAM_FGA=85,
+    TEAM_FGM=40,
+    TEAM_FTA=20,
+    TEAM_FTM=15,
+    TEAM_OREB=10,
+    TEAM_AST=25,
+    TEAM_TOV=12,
+    TEAM_MP=240,
+    OPP_DREB=30,
+)
+
+
+def test_floor_pct_dispatches_list_and_numpy_scalar_inputs():
+    player_stats = PlayerStats()
+    expected = player_stats.floor_pct(**FLOOR_PCT_INPUTS)
+    lists = {key: [value, value] for key, value in FLOOR_PCT_INPUTS.items()}
+    np.testing.assert_allclose(
+        player_stats.floor_pct(**lists), np.full(2, expected), rtol=1e-6
+    )
+    scalars = {key: np.int64(value) for key, value in FLOOR_PCT_INPUTS.items()}
+    assert player_stats.floor_pct(**scalars) == pytest.approx(expected, rel=1e-6)
+
+
+@pytest.mark.parametrize("stat", ["offensive_rating", "floor_pct"])
+def test_player_ratings_dispatch_their_own_inputs(stat):
+    assert hasattr(getattr(PlayerStats, stat), "__wrapped__")  # _scalar_or_array
+
+
+def test_scoring_possessions_broadcasts_precomputed_team_terms():
+    player_stats = PlayerStats()
+    expected = player_stats._scoring_possessions(**FLOOR_PCT_INPUTS)
+    team_scoring_poss = player_stats._team_scoring_possessions(
+        TEAM_FGM=40, TEAM_FTA=20, TEAM_FTM=15
+    )
+    np.testing.assert_allclose(
+        player_stats._scoring_possessions(
+            **FLOOR_PCT_INPUTS, TEAM_SCORING_POSS=np.full(3, team_scoring_poss)
+        ),
+        np.full(3, expected),
+        rtol=1e-6,
+    )
+    scalars = {key: np.float32(value) for key, value in FLOOR_PCT_INPUTS.items()}
+    assert player_stats._scoring_possessions(**scalars) == pytest.approx(
+        expected, rel=1e-5
+    )
+
+
+POINTS_PRODUCED_INPUTS = dict(FLOOR_PCT_INPUTS, FG3M=2, TEAM_FG3M=12)
+
+
+def test_points_produced_broadcasts_precomputed_team_terms():
+    player_stats = PlayerStats()
+    expected = player_stats.points_produced(**POINTS_PRODUCED_INPUTS)
+    team_scoring_poss = player_stats._team_scoring_possessions(
+        TEAM_FGM=40, TEAM_FTA=20, TEAM_FTM=15
+    )
+    np.testing.assert_allclose(
+        player_stats.points_produced(
+            **POINTS_PRODUCED_INPUTS, TEAM_SCORING_POSS=np.full(3, team_scoring_poss)
+        ),
+        np.full(3, expected),
+        rtol=1e-6,
+    )
+    scalars = {key: np.float32(value) for key, value in POINTS_PRODUCED_INPUTS.items()}
+    assert player_stats.points_produced(**scalars) == pytest.approx(expected, rel=1e-5)
+
+
+def _player_games(n_players=3, n_groups=4, seed=0):
+    """Player rows whose TEAM_/OPP_ columns are constant within each team-game."""
+    player_stats = PlayerStats()
+    rng = np.random.default_rng(seed)
+    n = n_players * n_groups
+    df = pd.DataFrame(
+        {
+            name: rng.integers(1, 50, n).astype(float)
+            for name in player_stats.required_stat_params
+        }
+    )
+    df["MP"] = rng.integers(0, 40, n).astype(float)  # Includes players who sat out
+    df["TEAM_MP"] = 240.0
+    df["GAME_ID"] = np.repeat(np.arange(n_groups) // 2, n_players).astype(float)
+    df["TEAM_ID"] = np.repeat(np.arange(n_groups) % 2, n_players)
+    team_columns = [name for name in df.columns if name.startswith(("TEAM_", "OPP_"))]
+    team_columns.remove("TEAM_ID")
+    df[team_columns] = (
+        df.groupby(["GAME_ID", "TEAM_ID"])[team_columns].transform("first").to_numpy()
+    )
+    return player_stats, df
+
+
+def test_compute_grouped_matches_compute_all_with_missing_group_keys():
+    player_stats, df = _player_games()
+    df.loc[df.index[-3:], "GAME_ID"] = np.nan  # One team-game without a GAME_ID
+    stat_names = list(player_stats.independent_stat_method_map) + list(
+        player_stats.dependent_stat_method_map
+    )
+    pd.testing.assert_frame_equal(
+        player_stats.compute_grouped(df, stat_names),
+        player_stats.compute_all(df, stat_names),
+        rtol=1e-5,
+    )
+
+
+@pytest.mark.parametrize("stat", ["total_possessions", "offensive_rating", "floor_pct"])
+def test_total_possessions_broadcasts_per_player_inputs(stat):
+    player_stats = PlayerStats()
+    expected = getattr(player_stats, stat)(**POINTS_PRODUCED_INPUTS)
+    inputs = {key: [value] for key, value in POINTS_PRODUCED_INPUTS.items()}
+    inputs["AST"] = [5, 5, 5]
+    np.testing.assert_allclose(
+        getattr(player_stats, stat)(**inputs), np.full(3, expected), rtol=1e-5
+    )
+
+
+@pytest.mark.parametrize("scalar", [np.int64, np.float32, np.float64])
+def test_two_point_stats_accept_numpy_scalars(scalar):
+    team_stats = TeamStats()
+    assert team_stats.two_point_pct(
+        FGA=scalar(90), FGM=scalar(40), FG3A=scalar(30), FG3M=scalar(10)
+    ) == pytest.approx(0.5)
+    assert team_stats.two_point_attempt_rate(
+        FGA=scalar(90), FG3A=scalar(30)
+    ) == pytest.approx(2 / 3)
+
+
+def test_two_point_pct_broadcasts_attempts_against_scalar_makes():
+    FGA = np.array([90.0, 80.0, 60.0])
+    FG3A = np.array([30.0, 40.0, 20.0])
+    np.testing.assert_allclose(
+        TeamStats().two_point_pct(FGA=FGA, FGM=40, FG3A=FG3A, FG3M=10),
+        30 / (FGA - FG3A),
+        rtol=1e-6,
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize(
+    "stats_class, params",
+    [(TeamStats, "all_required_stat_params"), (PlayerStats, "required_stat_params")],
+)
+def test_compiled_kernel_matches_compute_stats(stats_class, params, seed):
+    stats = stats_class()
+    rng = np.random.default_rng(seed)
+    names = sorted(stats.stat_expressions)
+    stat_names = list(rng.choice(names, rng.integers(1, len(names) + 1), replace=False))
+    # Small counts, so many rows have zero denominators
+    data = {
+        name: rng.integers(0, 4, 64).astype(float) for name in getattr(stats, params)
+    }
+    compiled = stats.compile_stats(stat_names)(data)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        computed = stats.compute_stats(stat_names, data)
+    for stat_name in stat_names:
+        np.testing.assert_allclose(
+            compiled[stat_name],
+            computed[stat_name],
+            rtol=1e-5,
+            equal_nan=True,
+            err_msg=stat_name,
+        )
+
+
+TEAM_RATING_INPUTS = dict(
+    PTS=110,
+    OPP_PTS=105,
+    FGA=85,
+    FGM=40,
+    FTA=20,
+    DREB=33,
+    OREB=10,
+    TOV=12,
+    MP=240,
+    OPP_FGA=88,
+    OPP_FGM=39,
+    OPP_FTA=18,
+    OPP_OREB=9,
+    OPP_DREB=30,
+    OPP_TOV=14,
+)
+
+
+@pytest.mark.parametrize(
+    "stat, name",
+    [
+        ("pace", "FGA"),
+        ("pace", "MP"),
+        ("offensive_rating", "FGA"),
+        ("defensive_rating", "FGA"),
+    ],
+)
+def test_team_rates_broadcast_any_array_input(stat, name):
+    team_stats = TeamStats()
+    expected = getattr(team_stats, stat)(**TEAM_RATING_INPUTS)
+    inputs = {key: [value] for key, value in TEAM_RATING_INPUTS.items()}
+    inputs[name] = [TEAM_RATING_INPUTS[name]] * 3
+    np.testing.assert_allclose(
+        getattr(team_stats, stat)(**inputs), np.full(3, expected), rtol=1e-5
+    )
+
+
+@pytest.mark.parametrize("scalar", [np.int64, np.float32, np.float64])
+def test_rebound_and_turnover_rates_accept_numpy_scalars(scalar):
+    team_stats = TeamStats()
+    assert team_stats.rebound_pct(REB=scalar(40), OPP_REB=scalar(60)) == pytest.approx(
+        0.4
+    )
+    assert team_stats.defensive_rebound_pct(
+        DREB=scalar(30), OPP_OREB=scalar(10)
+    ) == pytest.approx(0.75)
+    assert team_stats.offensive_rebound_pct(
+        OREB=scalar(10), OPP_DREB=scalar(30)
+    ) == pytest.approx(0.25)
+    assert team_stats.turnover_pct(
+        FGA=scalar(80), FTA=scalar(20), TOV=scalar(12)
+    ) == pytest.approx(12 / (80 + 0.44 * 20 + 12), rel=1e-6)